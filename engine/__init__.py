@@ -0,0 +1 @@
+# engine/__init__.py
@@ -0,0 +1,64 @@
+# engine/animation.py
+import math
+
+import pygame
+
+
+def pulse_frames(surface, amplitude, period, fps=30):
+    """
+    One loop of a "breathing" scale animation: scale goes
+    1 + amplitude * cos(2*pi*t / period). Returns the smoothscaled frames.
+    """
+    count = max(1, round(period * fps))
+    w, h = surface.get_size()
+    frames = []
+    for i in range(count):
+        scale = 1.0 + amplitude * math.cos(2 * math.pi * i / count)
+        frames.append(pygame.transform.smoothscale(surface, (int(w * scale), int(h * scale))))
+    return frames
+
+
+class AnimatedSprite:
+    """
+    Pre-rendered frames played back by elapsed time, optionally moving
+    in a straight line from start to end over travel_time seconds.
+
+    Frames are built once up front, so drawing is a single blit.
+    """
+
+    def __init__(self, frames, fps=30, loop=True, start=(0, 0), end=None, travel_time=0.0):
+        self.frames = list(frames)
+        self.fps = fps
+        self.loop = loop
+        self.start = start
+        self.end = end
+        self.travel_time = travel_time
+
+    def frame(self, t):
+        i = int(t * self.fps)
+        n = len(self.frames)
+        return self.frames[i % n if self.loop else min(i, n - 1)]
+
+    def position(self, t):
+        if self.end is None or self.travel_time <= 0:
+            return self.start
+        k = min(1.0, max(0.0, t / self.travel_time))
+        return (
+            self.start[0] + (self.end[0] - self.start[0]) * k,
+            self.start[1] + (self.end[1] - self.start[1]) * k,
+        )
+
+    def bounds(self, anchor="center"):
+        # box that holds every frame at the start position
+        w = max(f.get_width() for f in self.frames)
+        h = max(f.get_height() for f in self.frames)
+        rect = pygame.Rect(0, 0, w, h)
+        setattr(rect, anchor, self.start)
+        return rect
+
+    def draw(self, surface, t, anchor="center"):
+        image = self.frame(t)
+        x, y = self.position(t)
+        rect = image.get_rect(**{anchor: (int(x), int(y))})
+        surface.blit(image, rect)
+        return rect
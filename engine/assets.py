@@ -0,0 +1,104 @@
+# engine/assets.py
+import os
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AssetCache:
+    """
+    One shared image cache for every screen.
+
+    Converted and pre-scaled variants are kept by (path, size, alpha),
+    so asking for the same sprite again is just a dict lookup. Only the
+    variant asked for is kept: the decoded file and its full-size
+    converted copy are dropped once the variant is built, unless
+    image() is called with keep_decoded=True (more sizes of one file
+    to come).
+    """
+
+    def __init__(self):
+        self._decoded = {}    # path -> surface straight from the decoder (keep_decoded only)
+        self._variants = {}   # (path, size, alpha) -> converted surface
+        self._sounds = {}     # path -> pygame.mixer.Sound
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, path):
+        if os.path.isabs(path):
+            return path
+        return os.path.join(BASE_DIR, path)
+
+    def image(self, path, size=None, alpha=True, keep_decoded=False):
+        path = self.resolve(path)
+        size = tuple(size) if size is not None else None
+        key = (path, size, alpha)
+
+        surf = self._variants.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        raw = self._decoded.get(path)
+        if raw is None:
+            raw = pygame.image.load(path)
+            if keep_decoded:
+                self._decoded[path] = raw
+        # smoothscale needs 24/32 bit pixels, so convert first
+        surf = raw.convert_alpha() if alpha else raw.convert()
+        if size is not None and size != surf.get_size():
+            surf = pygame.transform.smoothscale(surf, size)
+        self._variants[key] = surf
+        return surf
+
+    def has(self, path, size=None, alpha=True):
+        size = tuple(size) if size is not None else None
+        return (self.resolve(path), size, alpha) in self._variants
+
+    def store(self, path, size, alpha, surface):
+        # surface decoded (and scaled) elsewhere, e.g. on a loader thread;
+        # converting to the display format has to happen here, on the main thread
+        size = tuple(size) if size is not None else None
+        surf = surface.convert_alpha() if alpha else surface.convert()
+        self._variants[(self.resolve(path), size, alpha)] = surf
+        return surf
+
+    def evict(self, path, size=None, alpha=True):
+        # forget one variant (e.g. a screen that is done with it); other
+        # sizes of the same file stay cached
+        path = self.resolve(path)
+        size = tuple(size) if size is not None else None
+        self._variants.pop((path, size, alpha), None)
+        if not any(k[0] == path for k in self._variants):
+            self._decoded.pop(path, None)
+
+    def sound(self, path):
+        path = self.resolve(path)
+        snd = self._sounds.get(path)
+        if snd is not None:
+            self.hits += 1
+            return snd
+        self.misses += 1
+        snd = pygame.mixer.Sound(path)
+        self._sounds[path] = snd
+        return snd
+
+    def store_sound(self, path, sound):
+        self._sounds[self.resolve(path)] = sound
+
+    def has_sound(self, path):
+        return self.resolve(path) in self._sounds
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files": len(self._decoded),
+            "variants": len(self._variants),
+            "sounds": len(self._sounds),
+        }
+
+
+# shared by every screen
+assets = AssetCache()
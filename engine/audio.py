@@ -0,0 +1,128 @@
+# engine/audio.py
+import time
+
+import pygame
+from engine.assets import assets
+from settings import AUDIO_GROUPS
+
+
+class AudioManager:
+    """
+    Sound playback shared by every screen.
+
+    Clips are decoded once (through the asset cache) and registered by
+    name. Each group gets its own reserved mixer channels, so a burst
+    in one group (slices) can't take the channels another group needs
+    (start / game over stingers); when all of a group's channels are
+    busy the next play cuts the one that was started longest ago. Clips
+    can have a minimum interval between plays. Music stays loaded after
+    stop_music(), so playing the same track again doesn't reload it.
+    """
+
+    def __init__(self, groups=AUDIO_GROUPS):
+        self.group_sizes = dict(groups)
+        self.ok = False
+        self._groups = {}        # group -> [Channel]
+        self._next = {}          # group -> index of the channel to try first
+        self._clips = {}         # name -> Sound
+        self._min_gap = {}       # name -> seconds
+        self._last_play = {}     # name -> perf_counter of the last play
+        self._music = None
+        self._music_failed = set()
+        self.played = 0
+        self.dropped = 0         # rate limited
+        self.stolen = 0          # cut another voice of the group
+
+    def available(self):
+        if not self.ok and pygame.mixer.get_init():
+            reserved = sum(self.group_sizes.values())
+            if pygame.mixer.get_num_channels() < reserved + 4:
+                pygame.mixer.set_num_channels(reserved + 4)
+            # reserved channels are never handed out by Sound.play()
+            pygame.mixer.set_reserved(reserved)
+            first = 0
+            for group, n in self.group_sizes.items():
+                self._groups[group] = [pygame.mixer.Channel(first + i) for i in range(n)]
+                self._next[group] = 0
+                first += n
+            self.ok = True
+        return self.ok
+
+    def load(self, name, path, volume=1.0, min_interval_ms=0):
+        if not self.available():
+            return None
+        snd = self._clips.get(name)
+        if snd is None:
+            try:
+                snd = assets.sound(path)
+            except (pygame.error, OSError):
+                return None
+            snd.set_volume(volume)
+            self._clips[name] = snd
+            self._min_gap[name] = min_interval_ms / 1000
+        return snd
+
+    def play(self, name, group, loops=0):
+        snd = self._clips.get(name)
+        if snd is None:
+            return None
+
+        gap = self._min_gap[name]
+        if gap:
+            now = time.perf_counter()
+            if now - self._last_play.get(name, -gap) < gap:
+                self.dropped += 1
+                return None
+            self._last_play[name] = now
+
+        # round robin: the first idle channel from where the last play
+        # left off, otherwise the one after it (the oldest voice)
+        channels = self._groups[group]
+        start = self._next[group]
+        channel = None
+        for i in range(len(channels)):
+            c = channels[(start + i) % len(channels)]
+            if not c.get_busy():
+                channel = c
+                start = (start + i) % len(channels)
+                break
+        if channel is None:
+            channel = channels[start]
+            self.stolen += 1
+        self._next[group] = (start + 1) % len(channels)
+
+        channel.play(snd, loops=loops)
+        self.played += 1
+        return channel
+
+    def stop(self, channel, name):
+        # only if the channel still plays that clip (it may have been reused)
+        snd = self._clips.get(name)
+        if channel is not None and snd is not None and channel.get_sound() is snd:
+            channel.stop()
+
+    def play_music(self, path, volume=1.0, loops=-1):
+        if not self.available():
+            return False
+        path = assets.resolve(path)
+        if path in self._music_failed:
+            return False
+        if self._music != path:
+            try:
+                pygame.mixer.music.load(path)
+            except (pygame.error, OSError):
+                self._music_failed.add(path)   # don't hit the disk again every round
+                return False
+            self._music = path
+        pygame.mixer.music.set_volume(volume)
+        if not pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(loops)
+        return True
+
+    def stop_music(self):
+        if self.ok:
+            pygame.mixer.music.stop()
+
+
+# shared by every screen
+audio = AudioManager()
@@ -0,0 +1,190 @@
+# engine/autoplay.py
+import random
+
+from engine.replay import LEFT, RIGHT, SPACE
+
+# reaction: ticks between decisions (the bot holds its keys in between)
+# aim_error: px the bot may be off when lining up a target
+# bomb_margin: extra px kept between the blade and a bomb
+# horizon: how many ticks ahead a falling bomb is taken into account
+# dash: whether SPACE is used to cover long distances
+# blunder: chance per decision to ignore bombs altogether
+SKILLS = {
+    "novice": {"reaction": 14, "aim_error": 30, "bomb_margin": 0, "horizon": 15, "dash": False, "blunder": 0.02},
+    "average": {"reaction": 7, "aim_error": 14, "bomb_margin": 6, "horizon": 30, "dash": True, "blunder": 0.004},
+    "expert": {"reaction": 2, "aim_error": 4, "bomb_margin": 10, "horizon": 45, "dash": True, "blunder": 0.0},
+}
+
+POWERUP_VALUE = 30
+
+# Ninja movement, as in Ninja.update
+DASH_SPEED = 15
+DASH_TICKS = 10
+# the blade spans ninja.x - 60 .. ninja.x + 60 plus up to 40 px more to
+# the right (half the sword reach), depending on the sword angle
+BLADE_LEFT = 60
+BLADE_RIGHT = 100
+BLADE_SLACK = 12      # the band also moves up and down a little while slashing
+
+ACTIONS = (0, LEFT, RIGHT, LEFT | SPACE, RIGHT | SPACE)
+
+
+class AutoPlayer:
+    """
+    Plays GameScreen from the live fruit / bomb / power-up lists.
+
+    decide() returns the same input bits the keyboard would produce
+    for this tick (see engine.replay), so bot rounds can be recorded
+    and replayed like any other. The bot picks the target worth the
+    most per tick of waiting, then tries each possible key combination
+    against the bombs that will cross the blade band within its horizon
+    and takes the safe one that gets it closest to the target.
+    """
+
+    def __init__(self, skill="average", seed=None):
+        if skill not in SKILLS:
+            raise ValueError(f"unknown skill {skill!r}, expected one of {', '.join(SKILLS)}")
+        self.skill = skill
+        for key, value in SKILLS[skill].items():
+            setattr(self, key, value)
+        self.rng = random.Random(seed)
+        # follow-ups tried after each action; the shortest comes first
+        self._holds = sorted({self.reaction, max(self.reaction, 8), max(self.reaction, 16),
+                              max(self.reaction, self.horizon)})
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+        self.wait = 0
+        self.bits = 0
+        self.target = None
+        self.offset = 0
+
+    def decide(self, game):
+        if self.wait > 0:
+            self.wait -= 1
+            # a dash starts on the press; holding SPACE adds nothing
+            self.bits &= ~SPACE
+            return self.bits
+        self.wait = self.reaction - 1
+        self.bits = self._plan(game)
+        return self.bits
+
+    def _plan(self, game):
+        ninja = game.ninja
+        band_top = ninja.slash_rect.top - BLADE_SLACK
+        band_bottom = ninja.slash_rect.bottom + BLADE_SLACK
+        lo = ninja.width // 2
+        hi = game.width - ninja.width // 2
+
+        danger = [] if self.rng.random() < self.blunder else self._danger(game, band_top, band_bottom)
+        goal = self._pick_target(game, ninja, band_top, band_bottom, danger)
+        if goal is None:
+            goal = game.width // 2
+        goal = max(lo, min(hi, goal))
+
+        best = None
+        best_cost = None
+        for bits in ACTIONS:
+            if bits & SPACE and (not self.dash or ninja.dash_cooldown):
+                continue
+            # an action is as safe as the best way of following it up:
+            # keep going for a while, then stop
+            step = None
+            hits = None
+            for hold in self._holds:
+                path = self._path(ninja, bits, hold, lo, hi)
+                if step is None:
+                    step = path[self.reaction - 1]   # where this decision leaves us
+                n = sum(1 for span in danger if self._collides(path, span))
+                if hits is None or n < hits:
+                    hits = n
+                if not n:
+                    break
+            # safety first, then distance to the goal
+            cost = (hits, abs(step - goal) + (8 if bits & SPACE else 0))
+            if best_cost is None or cost < best_cost:
+                best, best_cost = bits, cost
+        return best
+
+    def _path(self, ninja, bits, hold, lo, hi):
+        # ninja x for every tick of the horizon with `bits` held for
+        # `hold` ticks, then standing still (mirrors Ninja.update)
+        x = ninja.x
+        cooldown = ninja.dash_cooldown
+        direction = ninja.dash_direction
+        speed = ninja.speed
+        path = []
+        for k in range(max(self.horizon, self.reaction)):
+            held = bits if k < hold else 0
+            if held & LEFT and x > lo:
+                x -= speed
+            if held & RIGHT and x < hi:
+                x += speed
+            if held & SPACE and k == 0 and cooldown == 0:
+                direction = -1 if held & LEFT else 1
+                cooldown = DASH_TICKS + 20
+            if cooldown > 20:
+                x = max(lo, min(hi, x + direction * DASH_SPEED))
+            if cooldown > 0:
+                cooldown -= 1
+                if cooldown == 0:
+                    direction = 0
+            path.append(x)
+        return path
+
+    def _collides(self, path, span):
+        left, right, first, last = span
+        for k in range(max(0, first), min(len(path), last + 1)):
+            x = path[k]
+            if x - BLADE_LEFT < right and x + BLADE_RIGHT > left:
+                return True
+        return False
+
+    def _danger(self, game, band_top, band_bottom):
+        # (left, right, first tick, last tick) a bomb overlaps the blade band
+        spans = []
+        margin = self.bomb_margin
+        for bomb in game.bombs:
+            r = bomb.size / 2
+            if bomb.y - r > band_bottom:
+                continue
+            first = int((band_top - (bomb.y + r)) / bomb.speed)
+            if first > self.horizon:
+                continue
+            last = int((band_bottom - (bomb.y - r)) / bomb.speed) + 1
+            spans.append((bomb.x - r - margin, bomb.x + r + margin, first, last))
+        return spans
+
+    def _pick_target(self, game, ninja, band_top, band_bottom, danger):
+        speed = ninja.speed
+        dash = DASH_SPEED * DASH_TICKS if self.dash else 0
+        centre = (BLADE_RIGHT - BLADE_LEFT) / 2
+        best = None
+        best_score = 0.0
+        candidates = [(f, f.points * (2 if f.is_critical else 1)) for f in game.fruits]
+        candidates += [(p, POWERUP_VALUE) for p in game.powerups]
+        for obj, value in candidates:
+            r = obj.size / 2
+            if obj.sliced or obj.y - r > band_bottom:
+                continue
+            t = max(0, int((band_top - (obj.y + r)) / obj.speed))
+            # ninja x that puts the middle of the blade under it
+            x = obj.x - centre
+            if abs(x - ninja.x) - BLADE_LEFT > t * speed + dash:
+                continue
+            # don't line up under a fruit that lands together with a bomb
+            if any(left - BLADE_RIGHT < x < right + BLADE_LEFT and first - 10 <= t <= last + 10
+                   for left, right, first, last in danger):
+                continue
+            score = value / (t + 10)
+            if score > best_score:
+                best, best_score = obj, score
+
+        if best is None:
+            self.target = None
+            return None
+        if best is not self.target:
+            self.target = best
+            self.offset = self.rng.uniform(-self.aim_error, self.aim_error)
+        return best.x - centre + self.offset
@@ -0,0 +1,133 @@
+# engine/background.py
+import math
+import os
+
+import pygame
+from engine.assets import assets
+
+IMAGE_DIR = os.path.join("assets", "images")
+
+# name -> image file; "dojo" is drawn instead of loaded
+BACKGROUND_IMAGES = {
+    "gameplay": "background_gameplay.png",
+    "1": "1.png",
+    "2": "2.png",
+    "3": "3.png",
+    "4": "4.png",
+    "5": "5.png",
+}
+BACKGROUND_NAMES = ["dojo"] + list(BACKGROUND_IMAGES)
+
+
+def background_path(name):
+    return os.path.join(IMAGE_DIR, BACKGROUND_IMAGES[name])
+
+
+COLORKEY = (255, 0, 255)
+BLOSSOMS = [(50, 90), (120, 110), (170, 100)]
+
+
+PHASE_AMPLITUDE = 20
+
+
+def bake_sky_columns(height):
+    # every row of the gradient is one colour, so each phase step is a
+    # 1 px wide column that gets stretched across the screen when drawn
+    columns = {}
+    for phase in range(-PHASE_AMPLITUDE, PHASE_AMPLITUDE + 1):
+        col = pygame.Surface((1, height)).convert()
+        for i in range(height):
+            ratio = i / height
+            r = int(40 + ratio * 80 + phase)
+            g = int(20 + ratio * 50 + phase)
+            b = int(60 + ratio * 80 + phase)
+            col.set_at((0, i), (r, g, b))
+        columns[phase] = col
+    return columns
+
+
+def bake_scenery(width, height):
+    # mountains, hut and branch: never change, drawn over the sky
+    layer = pygame.Surface((width, height)).convert()
+    layer.fill(COLORKEY)
+    layer.set_colorkey(COLORKEY, pygame.RLEACCEL)
+
+    points = [
+        (0, height // 2 + 80),
+        (150, height // 2 - 20),
+        (300, height // 2 + 60),
+        (450, height // 2 - 40),
+        (600, height // 2 + 40),
+        (width, height // 2 + 20),
+        (width, height),
+        (0, height),
+    ]
+    pygame.draw.polygon(layer, (30, 20, 50), points)
+
+    pygame.draw.rect(layer, (20, 15, 35), (650, height // 2 + 50, 30, 80))
+    pygame.draw.polygon(layer, (20, 15, 35), [(630, height // 2 + 50), (665, height // 2 + 30), (700, height // 2 + 50)])
+
+    pygame.draw.line(layer, (60, 40, 30), (0, 100), (200, 180), 8)
+    return layer
+
+
+class BackgroundLayers:
+    """
+    Gameplay backgrounds, baked once and selectable by name.
+
+    Every background is made ready when this is built (the image ones
+    pre-converted and pre-scaled through the shared cache), so select()
+    and cycle() never load anything mid-round. The dojo scene is baked
+    into one gradient column per phase step and a colorkeyed scenery
+    layer. A frame is one stretched column, one scenery blit and the
+    three bobbing blossoms.
+    """
+
+    def __init__(self, width, height, name="dojo"):
+        self.width = width
+        self.height = height
+        self._sky = bake_sky_columns(height)
+        self._scenery = bake_scenery(width, height)
+        self._frame = pygame.Surface((width, height)).convert()
+        self._still = None
+        self._images = {
+            n: assets.image(background_path(n), (width, height), alpha=False)
+            for n in BACKGROUND_IMAGES
+        }
+        self.name = None
+        self.select(name)
+
+    def select(self, name):
+        self.name = name if name in BACKGROUND_NAMES else "dojo"
+
+    def cycle(self):
+        i = BACKGROUND_NAMES.index(self.name)
+        self.select(BACKGROUND_NAMES[(i + 1) % len(BACKGROUND_NAMES)])
+        return self.name
+
+    def draw(self, surface, t_ms, animate=True):
+        if self.name != "dojo":
+            surface.blit(self._images[self.name], (0, 0))
+            return
+
+        if not animate:
+            # whole scene frozen at t=0: a single blit
+            if self._still is None:
+                self._still = pygame.Surface((self.width, self.height)).convert()
+                self._draw_scene(self._still, 0)
+            surface.blit(self._still, (0, 0))
+            return
+        self._draw_scene(surface, t_ms)
+
+    def _draw_scene(self, surface, t_ms):
+        column = self._sky[round(math.sin(t_ms * 0.001) * PHASE_AMPLITUDE)]
+        if surface.get_size() == (self.width, self.height):
+            pygame.transform.scale(column, (self.width, self.height), surface)
+        else:
+            pygame.transform.scale(column, (self.width, self.height), self._frame)
+            surface.blit(self._frame, (0, 0))
+        surface.blit(self._scenery, (0, 0))
+
+        for pos in BLOSSOMS:
+            offset = math.sin(t_ms * 0.003 + pos[0]) * 3
+            pygame.draw.circle(surface, (255, 182, 193), (pos[0], int(pos[1] + offset)), 8)
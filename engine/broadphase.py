@@ -0,0 +1,41 @@
+# engine/broadphase.py
+
+
+class RowGrid:
+    """
+    Uniform grid of horizontal bands for cheap "what is near y?" queries.
+
+    Entities go into the row holding their centre; queries widen the
+    range by `margin` (the largest half-height) so nothing is missed.
+    Rows and the result list are reused, rebuilding costs one append
+    per entity and a query only touches the rows it overlaps.
+    """
+
+    def __init__(self, height, cell=64, margin=32):
+        self.cell = cell
+        self.margin = margin
+        self.rows = [[] for _ in range(height // cell + 1)]
+        self._result = []
+
+    def _row(self, y):
+        i = int(y) // self.cell
+        if i < 0:
+            return 0
+        last = len(self.rows) - 1
+        return last if i > last else i
+
+    def clear(self):
+        for row in self.rows:
+            row.clear()
+
+    def insert(self, obj, y):
+        self.rows[self._row(y)].append(obj)
+
+    def query(self, top, bottom):
+        # the returned list is reused by the next query
+        result = self._result
+        result.clear()
+        rows = self.rows
+        for i in range(self._row(top - self.margin), self._row(bottom + self.margin) + 1):
+            result.extend(rows[i])
+        return result
@@ -0,0 +1,180 @@
+# engine/disk_cache.py
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+from engine.assets import BASE_DIR
+from settings import ASSET_CACHE_DIR
+
+IMAGE_HEADER = struct.Struct("<4sIIB")   # magic, width, height, bytes per pixel
+IMAGE_MAGIC = b"ANI1"
+SOUND_HEADER = struct.Struct("<4sI")     # magic, sample frames
+SOUND_MAGIC = b"ANS1"
+
+
+class DiskCache:
+    """
+    Build-once cache of preprocessed assets on disk.
+
+    Images are stored as raw RGB/RGBA pixels already scaled to the size
+    a screen asks for; sounds as the mixer's decoded PCM. Files are
+    named after the SHA-1 of the source file plus the target size (or
+    mixer format), and read back through mmap. manifest.json remembers
+    each source's mtime/size/hash, so sources are only re-hashed after
+    they change; entries for an old hash are deleted then. Both kinds
+    of file start with a header giving their length; a file that is
+    too short or doesn't match (a write cut off by a power loss) counts
+    as a miss and is deleted, so the caller rebuilds it.
+    """
+
+    def __init__(self, root=ASSET_CACHE_DIR):
+        self.root = root if os.path.isabs(root) else os.path.join(BASE_DIR, root)
+        self._manifest_path = os.path.join(self.root, "manifest.json")
+        self._lock = threading.Lock()
+        self._manifest = None
+        self.hits = 0
+        self.misses = 0
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            try:
+                with open(self._manifest_path) as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def source_hash(self, path):
+        st = os.stat(path)
+        with self._lock:
+            entry = self._load_manifest().get(path)
+            if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                return entry["sha1"]
+
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+
+        with self._lock:
+            manifest = self._load_manifest()
+            old = manifest.get(path)
+            if old and old["sha1"] != digest:
+                self._forget(old["sha1"])
+            manifest[path] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha1": digest}
+            os.makedirs(self.root, exist_ok=True)
+            self._write_atomic(self._manifest_path, json.dumps(manifest, indent=1).encode())
+        return digest
+
+    def _forget(self, digest):
+        for name in os.listdir(self.root):
+            if name.startswith(digest):
+                try:
+                    os.remove(os.path.join(self.root, name))
+                except OSError:
+                    pass
+
+    def _write_atomic(self, path, data):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            # on disk before the rename, or a crash can leave a short file
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _read_mapped(self, path):
+        # returns an open mmap, or None if there is no cache file
+        try:
+            with open(path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def _discard(self, path):
+        # a short or corrupt entry: count a miss and delete it so it gets rebuilt
+        self.misses += 1
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    # ------------------ images ------------------
+    def _image_file(self, path, size, alpha):
+        w, h = size
+        return os.path.join(self.root, f"{self.source_hash(path)}_{w}x{h}_{'rgba' if alpha else 'rgb'}.px")
+
+    def load_image(self, path, size, alpha):
+        name = self._image_file(path, size, alpha)
+        mm = self._read_mapped(name)
+        if mm is None:
+            self.misses += 1
+            return None
+        surf = None
+        try:
+            if len(mm) >= IMAGE_HEADER.size:
+                magic, w, h, bpp = IMAGE_HEADER.unpack_from(mm)
+                if magic == IMAGE_MAGIC and bpp in (3, 4) and len(mm) == IMAGE_HEADER.size + w * h * bpp:
+                    view = memoryview(mm)[IMAGE_HEADER.size:]
+                    # copy() so the surface no longer points into the mapping
+                    surf = pygame.image.frombuffer(view, (w, h), "RGBA" if bpp == 4 else "RGB").copy()
+                    view.release()
+        finally:
+            mm.close()
+        if surf is None:
+            return self._discard(name)
+        self.hits += 1
+        return surf
+
+    def save_image(self, path, size, alpha, surface):
+        fmt = "RGBA" if alpha else "RGB"
+        w, h = surface.get_size()
+        data = IMAGE_HEADER.pack(IMAGE_MAGIC, w, h, len(fmt)) + pygame.image.tobytes(surface, fmt)
+        os.makedirs(self.root, exist_ok=True)
+        self._write_atomic(self._image_file(path, size, alpha), data)
+
+    # ------------------ sounds ------------------
+    def _sound_file(self, path):
+        freq, fmt, channels = pygame.mixer.get_init()
+        return os.path.join(self.root, f"{self.source_hash(path)}_{freq}_{fmt}_{channels}.pcm")
+
+    def _frame_bytes(self):
+        _, fmt, channels = pygame.mixer.get_init()
+        return abs(fmt) // 8 * channels
+
+    def load_sound(self, path):
+        name = self._sound_file(path)
+        mm = self._read_mapped(name)
+        if mm is None:
+            self.misses += 1
+            return None
+        snd = None
+        try:
+            if len(mm) >= SOUND_HEADER.size:
+                magic, frames = SOUND_HEADER.unpack_from(mm)
+                if magic == SOUND_MAGIC and len(mm) == SOUND_HEADER.size + frames * self._frame_bytes():
+                    view = memoryview(mm)[SOUND_HEADER.size:]
+                    # Sound(buffer=...) copies the samples
+                    snd = pygame.mixer.Sound(buffer=view)
+                    view.release()
+        finally:
+            mm.close()
+        if snd is None:
+            return self._discard(name)
+        self.hits += 1
+        return snd
+
+    def save_sound(self, path, sound):
+        os.makedirs(self.root, exist_ok=True)
+        raw = sound.get_raw()
+        data = SOUND_HEADER.pack(SOUND_MAGIC, len(raw) // self._frame_bytes()) + raw
+        self._write_atomic(self._sound_file(path), data)
+
+
+disk_cache = DiskCache()
@@ -0,0 +1,135 @@
+# engine/display.py
+import pygame
+from settings import WIDTH, HEIGHT, SCALE_MODE
+
+LETTERBOX = (0, 0, 0)
+
+
+def fit(logical, output, mode=SCALE_MODE):
+    """
+    Where a `logical`-sized canvas goes in an `output`-sized window.
+
+    Returns (dest rect, whole-number factor or None). "fit" and
+    "smooth" use the largest size with the same aspect ratio. "integer"
+    uses the largest whole factor instead, unless that gives up more
+    than a quarter of the size (800x600 at 1x on a 1080p screen) or the
+    window is smaller than the canvas; then it fits too.
+    """
+    w, h = logical
+    out_w, out_h = output
+    k = min(out_w // w, out_h // h)
+    s = min(out_w / w, out_h / h)
+    if mode == "integer" and k >= 1 and k >= 0.75 * s:
+        size = (w * k, h * k)
+    else:
+        size = (max(1, int(w * s)), max(1, int(h * s)))
+        k = k if k >= 1 and size == (w * k, h * k) else None
+    dest = pygame.Rect((out_w - size[0]) // 2, (out_h - size[1]) // 2, *size)
+    return dest, k
+
+
+class Display:
+    """
+    The window, plus the fixed WIDTH x HEIGHT canvas screens draw on.
+
+    present() puts the canvas on the window with one scale (nearest
+    neighbour, or smoothscale in "smooth" mode), letterboxed. The
+    layout is worked out once per window size. When the window is the
+    canvas size the canvas *is* the window surface and dirty rects go
+    straight to display.update(); at whole-number factors each dirty
+    rect is scaled on its own; any other factor rescales the canvas.
+    After a mode change the canvas may be a new surface, so screens
+    have to redraw everything (see main.invalidate).
+    """
+
+    def __init__(self, size=(WIDTH, HEIGHT), mode=SCALE_MODE, fullscreen=False):
+        self.size = tuple(size)
+        self.mode = mode
+        self.fullscreen = fullscreen
+        self.window = None
+        self.canvas = None
+        self.dest = None
+        self.factor = None
+        self._target = None      # window area the canvas is scaled into
+        self._layouts = {}       # window size -> (dest, factor)
+        self._full = True
+        self.set_mode(fullscreen)
+
+    def set_mode(self, fullscreen):
+        self.fullscreen = fullscreen
+        if fullscreen:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(self.size, pygame.RESIZABLE)
+        self._layout()
+
+    def toggle_fullscreen(self):
+        self.set_mode(not self.fullscreen)
+
+    def resized(self):
+        # the window was resized by the user; pygame already resized the surface
+        self.window = pygame.display.get_surface()
+        self._layout()
+
+    def _layout(self):
+        out = self.window.get_size()
+        layout = self._layouts.get(out)
+        if layout is None:
+            layout = self._layouts[out] = fit(self.size, out, self.mode)
+        self.dest, self.factor = layout
+
+        if out == self.size:
+            self.canvas = self.window
+            self._target = None
+        else:
+            if self.canvas is None or self.canvas is self.window:
+                self.canvas = pygame.Surface(self.size).convert(self.window)
+            self.window.fill(LETTERBOX)
+            self._target = self.window.subsurface(self.dest)
+        self._full = True
+
+    def present(self, dirty=None):
+        # dirty: None = whole canvas, [] = nothing, else canvas rects
+        if self._full:
+            dirty = None
+        if self._target is None:
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            self._full = False
+            return
+
+        if dirty == []:
+            return
+        k = self.factor
+        if dirty is None or k is None or self.mode == "smooth":
+            self._scale(self.canvas, self._target)
+            if self._full:
+                pygame.display.flip()    # letterbox bars too
+            else:
+                pygame.display.update(self.dest)
+            self._full = False
+            return
+
+        bounds = self.canvas.get_rect()
+        rects = []
+        for r in dirty:
+            r = bounds.clip(r)
+            if not r.w or not r.h:
+                continue
+            out = pygame.Rect(self.dest.x + r.x * k, self.dest.y + r.y * k, r.w * k, r.h * k)
+            if k == 1:
+                self.window.blit(self.canvas, out, r)
+            else:
+                pygame.transform.scale(self.canvas.subsurface(r), out.size, self.window.subsurface(out))
+            rects.append(out)
+        pygame.display.update(rects)
+
+    def _scale(self, canvas, target):
+        if self.factor == 1:
+            target.blit(canvas, (0, 0))
+        elif self.mode == "smooth":
+            pygame.transform.smoothscale(canvas, target.get_size(), target)
+        else:
+            pygame.transform.scale(canvas, target.get_size(), target)
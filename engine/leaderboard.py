@@ -0,0 +1,149 @@
+# engine/leaderboard.py
+import bisect
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from engine.assets import BASE_DIR
+from settings import LEADERBOARD_PATH
+
+COLUMNS = ("played_at", "score", "level", "max_combo", "duration_ms",
+           "fruits_sliced", "bombs_hit", "critical_hits", "powerups_collected", "seed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    max_combo INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    fruits_sliced INTEGER NOT NULL,
+    bombs_hit INTEGER NOT NULL,
+    critical_hits INTEGER NOT NULL,
+    powerups_collected INTEGER NOT NULL,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, id);
+"""
+
+
+class Leaderboard:
+    """
+    Every finished run, kept in SQLite.
+
+    record() never touches the disk: runs are queued for a writer
+    thread that inserts them in batches (one transaction per batch) and
+    owns the only connection. The best `cache_size` runs are read once
+    through the score index when the writer starts and then kept up to
+    date in memory, so top() is a list slice.
+    """
+
+    def __init__(self, path=LEADERBOARD_PATH, cache_size=50, batch=64, flush_interval=1.0):
+        self.path = path if path == ":memory:" or os.path.isabs(path) else os.path.join(BASE_DIR, path)
+        self.cache_size = cache_size
+        self.batch = batch
+        self.flush_interval = flush_interval
+        self.errors = 0
+
+        self._top = []     # best runs first, at most cache_size
+        self._keys = []    # -score of each cached run, for bisect
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+        self._thread.start()
+
+    # ---- main thread ----
+    def record(self, score, level, max_combo, duration_ms, stats, seed=None):
+        run = {
+            "played_at": time.time(),
+            "score": int(score),
+            "level": int(level),
+            "max_combo": int(max_combo),
+            "duration_ms": int(duration_ms),
+            "fruits_sliced": stats.get("fruits_sliced", 0),
+            "bombs_hit": stats.get("bombs_hit", 0),
+            "critical_hits": stats.get("critical_hits", 0),
+            "powerups_collected": stats.get("powerups_collected", 0),
+            "seed": seed,
+        }
+        self._queue.put(run)
+        with self._lock:
+            self._insert_cached(run)
+        return run
+
+    def top(self, n=10, wait=0.25):
+        # the first call may have to wait for the writer to read the table
+        self._ready.wait(wait)
+        with self._lock:
+            return self._top[:n]
+
+    def best(self):
+        top = self.top(1)
+        return top[0]["score"] if top else 0
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _insert_cached(self, run):
+        # equal scores: the older run stays ahead
+        i = bisect.bisect_right(self._keys, -run["score"])
+        if i >= self.cache_size:
+            return
+        self._keys.insert(i, -run["score"])
+        self._top.insert(i, run)
+        del self._keys[self.cache_size:], self._top[self.cache_size:]
+
+    # ---- writer thread ----
+    def _run(self):
+        try:
+            db = sqlite3.connect(self.path)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            rows = db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM runs ORDER BY score DESC, id LIMIT ?", (self.cache_size,)
+            ).fetchall()
+        except sqlite3.Error:
+            self.errors += 1
+            db = None
+            rows = []
+        with self._lock:
+            pending = self._top
+            self._top, self._keys = [], []
+            for row in rows:
+                self._insert_cached(dict(zip(COLUMNS, row)))
+            # runs recorded before the table was read are still in the queue
+            for run in pending:
+                self._insert_cached(run)
+        self._ready.set()
+
+        insert = f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+        done = False
+        while not done:
+            runs = []
+            try:
+                run = self._queue.get(timeout=self.flush_interval)
+                while run is not None:
+                    runs.append(run)
+                    if len(runs) >= self.batch:
+                        break
+                    run = self._queue.get_nowait()
+                done = run is None
+            except queue.Empty:
+                pass
+            if runs and db is not None:
+                try:
+                    with db:
+                        db.executemany(insert, [tuple(r[c] for c in COLUMNS) for r in runs])
+                except sqlite3.Error:
+                    self.errors += 1
+        if db is not None:
+            db.close()
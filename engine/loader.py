@@ -0,0 +1,149 @@
+# engine/loader.py
+import io
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from engine.assets import assets
+from engine.disk_cache import disk_cache
+from settings import USE_DISK_CACHE
+
+
+def _decode_image(path, size, alpha):
+    use_disk = USE_DISK_CACHE and size is not None
+    if use_disk:
+        surf = disk_cache.load_image(path, size, alpha)
+        if surf is not None:
+            return surf
+
+    with open(path, "rb") as f:
+        data = f.read()
+    surf = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+    if size is not None and surf.get_size() != tuple(size):
+        surf = pygame.transform.smoothscale(surf, size)
+
+    if use_disk:
+        try:
+            disk_cache.save_image(path, size, alpha, surf)
+        except OSError:
+            pass   # read-only install etc.: just don't cache
+    return surf
+
+
+def _decode_sound(path):
+    if USE_DISK_CACHE:
+        snd = disk_cache.load_sound(path)
+        if snd is not None:
+            return snd
+
+    with open(path, "rb") as f:
+        data = f.read()
+    snd = pygame.mixer.Sound(file=io.BytesIO(data))
+
+    if USE_DISK_CACHE:
+        try:
+            disk_cache.save_sound(path, snd)
+        except OSError:
+            pass
+    return snd
+
+
+class AssetLoader:
+    """
+    Loads a list of assets in the background.
+
+    Worker threads read, decode and scale files; poll() (main thread)
+    converts what has finished to the display format and puts it into
+    the shared asset cache. Entries are ("image", path, size, alpha) or
+    ("sound", path). Files that fail to load are counted as done and
+    listed in `errors`; the screens will hit the same error if they
+    need them.
+    """
+
+    def __init__(self, entries=(), workers=4, cache=assets):
+        self.cache = cache
+        self.workers = workers
+        self.entries = []
+        self.errors = []
+        self.loaded = 0
+        self._results = queue.Queue()
+        self._pool = None
+        self.extend(entries)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        kind, path = entry[0], entry[1]
+        if kind == "image":
+            size, alpha = entry[2], entry[3]
+            if self.cache.has(path, size, alpha):
+                return
+        elif kind == "sound":
+            # no mixer (or already loaded): nothing to do
+            if not pygame.mixer.get_init() or self.cache.has_sound(path):
+                return
+        else:
+            raise ValueError(f"unknown asset kind {kind!r}")
+        if entry not in self.entries:
+            self.entries.append(entry)
+            if self._pool is not None:
+                self._pool.submit(self._work, entry)
+
+    @property
+    def total(self):
+        return len(self.entries)
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.entries else 1.0
+
+    @property
+    def done(self):
+        return self.loaded >= self.total
+
+    def start(self):
+        # entries added after start() are submitted straight away
+        if self._pool is not None:
+            return
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        for entry in self.entries:
+            self._pool.submit(self._work, entry)
+
+    def close(self):
+        # drop the queued jobs too: after a skip, screens load what they need themselves
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _work(self, entry):
+        path = self.cache.resolve(entry[1])
+        try:
+            if entry[0] == "image":
+                result = _decode_image(path, entry[2], entry[3])
+            else:
+                result = _decode_sound(path)
+            self._results.put((entry, result, None))
+        except Exception as exc:
+            self._results.put((entry, None, exc))
+
+    def poll(self, budget_ms=4.0):
+        # hand finished assets to the cache, for at most budget_ms
+        deadline = time.perf_counter() + budget_ms / 1000
+        while True:
+            try:
+                entry, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if error is not None:
+                self.errors.append((entry, error))
+            elif entry[0] == "image":
+                self.cache.store(entry[1], entry[2], entry[3], result)
+            else:
+                self.cache.store_sound(entry[1], result)
+            self.loaded += 1
+            if time.perf_counter() > deadline:
+                break
+        return self.done
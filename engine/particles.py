@@ -0,0 +1,158 @@
+# engine/particles.py
+import numpy as np
+import pygame
+
+SPLASH = 0
+EXPLOSION = 1
+PARTICLE_TYPES = {"splash": SPLASH, "explosion": EXPLOSION}
+
+# per type: speed range, size range (inclusive), lifetime, gravity
+SPEED = {SPLASH: (2, 6), EXPLOSION: (4, 10)}
+SIZE = {SPLASH: (3, 8), EXPLOSION: (5, 12)}
+LIFETIME = {SPLASH: 60, EXPLOSION: 90}
+GRAVITY = np.array([0.3, 0.5])
+
+EXPLOSION_GLOW = (255, 150, 0)
+
+# draw(): one pre-rendered circle per (colour, type, radius, fade step)
+FADE_STEPS = 32
+MAX_RADIUS = 12
+STAMP_KEY = (255, 0, 255)
+STAMPS_PER_COLOR = 2 * (MAX_RADIUS + 1) * FADE_STEPS
+
+
+class ParticleSystem:
+    """
+    All particles in flat NumPy arrays (struct of arrays).
+
+    emit() fills a batch of slots at once, update() moves every
+    particle in a handful of array ops and removes dead ones by
+    swapping the tail into their slots. Capacity is fixed; a burst
+    that doesn't fit is cut short. draw() is one surface.blits() of
+    circle stamps, each rendered the first time it is needed.
+    """
+
+    def __init__(self, capacity=4096, rng=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.color_id = np.zeros(capacity, dtype=np.int32)   # index into _colors
+        self.type = np.zeros(capacity, dtype=np.int8)
+
+        self._colors = []       # every colour emitted so far
+        self._color_ids = {}    # colour -> index into _colors
+        # stamp key (see draw) -> colorkeyed circle, None until first drawn
+        self._stamps = np.empty(0, dtype=object)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def seed(self, seed):
+        # separate stream from the gameplay RNG: effect quality changes
+        # how many particles are drawn, never what gets spawned
+        self.rng = np.random.default_rng(seed)
+
+    def emit(self, x, y, color, particle_type="splash", n=1):
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return
+        kind = PARTICLE_TYPES[particle_type]
+        s = slice(self.count, self.count + n)
+        rng = self.rng
+
+        angle = rng.uniform(0, 2 * np.pi, n)
+        speed = rng.uniform(*SPEED[kind], n)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = np.cos(angle) * speed
+        self.vy[s] = np.sin(angle) * speed - rng.uniform(1, 3, n)
+        lo, hi = SIZE[kind]
+        self.size[s] = rng.integers(lo, hi + 1, n)
+        self.lifetime[s] = LIFETIME[kind]
+        self.max_lifetime[s] = LIFETIME[kind]
+        color = tuple(color)
+        cid = self._color_ids.get(color)
+        if cid is None:
+            cid = self._color_ids[color] = len(self._colors)
+            self._colors.append(color)
+            self._stamps = np.concatenate((self._stamps, np.empty(STAMPS_PER_COLOR, dtype=object)))
+        self.color_id[s] = cid
+        self.type[s] = kind
+
+        self.count += n
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += GRAVITY[self.type[:n]]
+        self.lifetime[:n] -= 1
+        np.maximum(self.size[:n] - 0.1, 1, out=self.size[:n])
+        self._compact()
+
+    def _compact(self):
+        n = self.count
+        alive = self.lifetime[:n] > 0
+        k = int(np.count_nonzero(alive))
+        if k == n:
+            return
+        # swap-remove: live particles past the new end fill the dead slots before it
+        holes = np.flatnonzero(~alive[:k])
+        movers = np.flatnonzero(alive[k:]) + k
+        for arr in (self.x, self.y, self.vx, self.vy, self.size,
+                    self.lifetime, self.max_lifetime, self.color_id, self.type):
+            arr[holes] = arr[movers]
+        self.count = k
+
+    def draw(self, surface, alpha=1.0):
+        n = self.count
+        if n == 0:
+            return
+        kind = self.type[:n].astype(np.int32)
+        radius = np.minimum(self.size[:n].astype(np.int32), MAX_RADIUS)
+        fade = self.lifetime[:n] * (FADE_STEPS - 1) // self.max_lifetime[:n]
+        keys = ((self.color_id[:n] * 2 + kind) * (MAX_RADIUS + 1) + radius) * FADE_STEPS + fade
+
+        stamps = self._stamps[keys]
+        missing = np.equal(stamps, None)
+        if missing.any():
+            for key in set(keys[missing].tolist()):
+                self._stamps[key] = self._stamp(key)
+            stamps = self._stamps[keys]
+
+        # step back towards the previous tick for interpolated rendering,
+        # then to the stamp's corner (explosions have a 2 px glow ring)
+        back = 1.0 - alpha
+        offset = radius + 2 * kind
+        xs = ((self.x[:n] - self.vx[:n] * back).astype(np.int32) - offset).tolist()
+        ys = ((self.y[:n] - (self.vy[:n] - GRAVITY[self.type[:n]]) * back).astype(np.int32) - offset).tolist()
+        surface.blits(zip(stamps.tolist(), zip(xs, ys)), False)
+
+    def _stamp(self, key):
+        rest, fade = divmod(key, FADE_STEPS)
+        rest, r = divmod(rest, MAX_RADIUS + 1)
+        cid, kind = divmod(rest, 2)
+        color = tuple(int(c * fade / (FADE_STEPS - 1)) for c in self._colors[cid])
+
+        outer = r + 2 if kind == EXPLOSION else r
+        stamp = pygame.Surface((2 * outer + 1, 2 * outer + 1)).convert()
+        colorkey = STAMP_KEY if color != STAMP_KEY else (0, 0, 0)
+        stamp.fill(colorkey)
+        if kind == EXPLOSION:
+            pygame.draw.circle(stamp, EXPLOSION_GLOW, (outer, outer), r + 2)
+        pygame.draw.circle(stamp, color, (outer, outer), r)
+        stamp.set_colorkey(colorkey, pygame.RLEACCEL)
+        return stamp
@@ -0,0 +1,81 @@
+# engine/pool.py
+
+
+class EntityPool:
+    """
+    Free list of reusable instances of one class.
+
+    Pooled classes take their constructor arguments in reset() too,
+    so a recycled object looks exactly like a freshly built one.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args)
+
+    def release(self, obj):
+        self._free.append(obj)
+
+    def __len__(self):
+        return len(self._free)
+
+
+class EntityList:
+    """
+    Live entities of one kind, backed by a pool.
+
+    Order is not kept: despawn_at() moves the last entity into the
+    freed slot, so removal is O(1). Every entity knows its own index
+    in `slot`, so despawn(obj) is O(1) as well. Walk the list
+    backwards when despawning during iteration.
+    """
+
+    def __init__(self, cls):
+        self.items = []
+        self.pool = EntityPool(cls)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    def spawn(self, *args):
+        obj = self.pool.acquire(*args)
+        obj.slot = len(self.items)
+        self.items.append(obj)
+        return obj
+
+    def despawn_at(self, i):
+        items = self.items
+        obj = items[i]
+        last = items.pop()
+        if i < len(items):
+            items[i] = last
+            last.slot = i
+        obj.slot = -1
+        self.pool.release(obj)
+        return obj
+
+    def despawn(self, obj):
+        return self.despawn_at(obj.slot)
+
+    def clear(self):
+        for obj in self.items:
+            obj.slot = -1
+            self.pool.release(obj)
+        self.items.clear()
@@ -0,0 +1,129 @@
+# engine/profiler.py
+import csv
+import time
+from collections import deque
+
+import pygame
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullSection()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + (time.perf_counter() - self.start) * 1000
+        return False
+
+
+class FrameProfiler:
+    """
+    Per-section frame timings.
+
+    Wrap code in `with profiler.section("name"):` and call end_frame()
+    once per frame. Disabled, section() hands back a shared no-op
+    context, so the cost is one method call. Only the last `max_rows`
+    frames are kept for dump_csv(), so leaving it on doesn't grow
+    memory without bound.
+    """
+
+    def __init__(self, window=120, max_rows=36000):
+        self.enabled = False
+        self.window = window
+        self.current = {}      # section -> ms spent this frame
+        self.history = {}      # section -> recent ms values
+        self.order = []        # sections in first-seen order
+        self.rows = deque(maxlen=max_rows)   # one dict per recorded frame (for CSV), ~10 min at 60 fps
+        self._sections = {}
+        self._frame_start = time.perf_counter()
+        self._font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current.clear()
+        self._frame_start = time.perf_counter()
+        return self.enabled
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL
+        sec = self._sections.get(name)
+        if sec is None:
+            sec = self._sections[name] = _Section(self, name)
+        return sec
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        current = self.current
+        current["frame"] = (now - self._frame_start) * 1000
+        self._frame_start = now
+
+        for name, ms in current.items():
+            hist = self.history.get(name)
+            if hist is None:
+                hist = self.history[name] = deque(maxlen=self.window)
+                self.order.append(name)
+            hist.append(ms)
+        self.rows.append(dict(current))
+        self.current = {}
+
+    def summary(self):
+        # (name, rolling average ms, worst ms) per section
+        out = []
+        for name in self.order:
+            hist = self.history[name]
+            if hist:
+                out.append((name, sum(hist) / len(hist), max(hist)))
+        return out
+
+    def draw_overlay(self, surface):
+        if not self.enabled:
+            return
+        if self._font is None:
+            self._font = pygame.font.SysFont("consolas", 14)
+
+        lines = [f"{'section':<16}{'avg':>7}{'max':>8}"]
+        for name, avg, worst in self.summary():
+            lines.append(f"{name:<16}{avg:7.2f}{worst:8.2f}")
+
+        line_h = self._font.get_linesize()
+        panel = pygame.Surface((200, line_h * len(lines) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            panel.blit(self._font.render(line, True, (200, 255, 200)), (6, 4 + i * line_h))
+        surface.blit(panel, (surface.get_width() - panel.get_width() - 10, 60))
+
+    def dump_csv(self, path="profile.csv"):
+        if not self.rows:
+            return None
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.order, restval=0)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        self.rows.clear()
+        return path
+
+
+# shared by the main loop and the screens
+profiler = FrameProfiler()
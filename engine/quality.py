@@ -0,0 +1,86 @@
+# engine/quality.py
+from collections import deque
+
+from settings import FRAME_BUDGET_MS, QUALITY_PIN
+
+# lowest first
+QUALITY_LEVELS = [
+    {"name": "low", "particle_scale": 0.25, "critical_glow": False,
+     "powerup_glow": False, "bomb_sparks": False, "animated_background": False},
+    {"name": "medium", "particle_scale": 0.5, "critical_glow": True,
+     "powerup_glow": False, "bomb_sparks": True, "animated_background": True},
+    {"name": "high", "particle_scale": 1.0, "critical_glow": True,
+     "powerup_glow": True, "bomb_sparks": True, "animated_background": True},
+]
+QUALITY_NAMES = [q["name"] for q in QUALITY_LEVELS]
+
+
+class QualityGovernor:
+    """
+    Steps effect quality down when frames run over budget and back up
+    when there is plenty of headroom.
+
+    Stepping down looks at a short window (react quickly to bursts),
+    stepping up needs a long calm window, and every change is followed
+    by a cooldown so the level doesn't flap. The current settings are
+    plain attributes so hot paths can read them cheaply.
+    """
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, pin=QUALITY_PIN,
+                 down_window=30, up_window=180, cooldown=120):
+        self.budget_ms = budget_ms
+        self.down_window = down_window
+        self.up_window = up_window
+        self.cooldown = cooldown
+        self._recent = deque(maxlen=up_window)
+        self._cooldown_left = 0
+        self.pinned = pin is not None
+        self.set_level(QUALITY_NAMES.index(pin) if self.pinned else len(QUALITY_LEVELS) - 1)
+
+    def set_level(self, level):
+        self.level = max(0, min(len(QUALITY_LEVELS) - 1, level))
+        q = QUALITY_LEVELS[self.level]
+        self.name = q["name"]
+        self.particle_scale = q["particle_scale"]
+        self.critical_glow = q["critical_glow"]
+        self.powerup_glow = q["powerup_glow"]
+        self.bomb_sparks = q["bomb_sparks"]
+        self.animated_background = q["animated_background"]
+
+    def pin(self, name):
+        # None hands control back to the governor
+        self.pinned = name is not None
+        if self.pinned:
+            self.set_level(QUALITY_NAMES.index(name))
+        self._recent.clear()
+
+    def particles(self, n):
+        return max(1, int(n * self.particle_scale))
+
+    def record(self, frame_ms):
+        if self.pinned:
+            return
+        self._recent.append(frame_ms)
+        if self._cooldown_left > 0:
+            self._cooldown_left -= 1
+            return
+
+        recent = self._recent
+        if len(recent) >= self.down_window:
+            tail = list(recent)[-self.down_window:]
+            if sum(tail) / len(tail) > self.budget_ms and self.level > 0:
+                self._change(self.level - 1)
+                return
+
+        if len(recent) == self.up_window and self.level < len(QUALITY_LEVELS) - 1:
+            if sum(recent) / len(recent) < self.budget_ms * 0.6:
+                self._change(self.level + 1)
+
+    def _change(self, level):
+        self.set_level(level)
+        self._recent.clear()
+        self._cooldown_left = self.cooldown
+
+
+# shared by the main loop and gameplay
+quality = QualityGovernor()
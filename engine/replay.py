@@ -0,0 +1,126 @@
+# engine/replay.py
+import os
+import queue
+import struct
+import threading
+import time
+
+import pygame
+from engine.assets import BASE_DIR
+from settings import REPLAY_DIR
+
+HEADER = struct.Struct("<4sQ")   # magic, session seed
+MAGIC = b"ANR1"
+
+# one byte per simulation tick
+LEFT = 1
+RIGHT = 2
+SPACE = 4
+PAUSE = 8     # P was pressed since the previous tick (informational on replay)
+
+KEY_BITS = {pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT, pygame.K_SPACE: SPACE}
+
+
+def encode_keys(pressed, pause_toggled=False):
+    bits = PAUSE if pause_toggled else 0
+    for key, bit in KEY_BITS.items():
+        if pressed[key]:
+            bits |= bit
+    return bits
+
+
+def replay_path(seed, directory=REPLAY_DIR):
+    if not os.path.isabs(directory):
+        directory = os.path.join(BASE_DIR, directory)
+    return os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}_{seed}.rep")
+
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed() for the keys Ninja.update reads."""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits=0):
+        self.bits = bits
+
+    def __getitem__(self, key):
+        bit = KEY_BITS.get(key, 0)
+        return bool(self.bits & bit)
+
+
+class InputRecorder:
+    """
+    Writes a round's inputs to disk as it is played.
+
+    record() only appends to a buffer; full chunks are handed to a
+    writer thread, so the frame never waits on the file. close()
+    flushes the rest and waits for the writer.
+    """
+
+    def __init__(self, path, seed, chunk=512):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.seed = seed
+        self.chunk = chunk
+        self.ticks = 0
+        self._buffer = bytearray()
+        self._queue = queue.Queue()
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, seed))
+        self._thread = threading.Thread(target=self._write, name="replay-writer", daemon=True)
+        self._thread.start()
+
+    def _write(self):
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            self._file.write(data)
+        self._file.close()
+
+    def record(self, bits):
+        self._buffer.append(bits)
+        self.ticks += 1
+        if len(self._buffer) >= self.chunk:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self):
+        if self._thread is None:
+            return
+        if self._buffer:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+
+class InputReplay:
+    """Plays back a recorded round: the seed to start with, then one input byte per tick."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"not a replay file: {path}")
+        magic, self.seed = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"not a replay file: {path}")
+        self.path = path
+        self.inputs = data[HEADER.size:]
+        self.pos = 0
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def rewind(self):
+        self.pos = 0
+
+    def next_tick(self):
+        # None once the recording has run out
+        if self.pos >= len(self.inputs):
+            return None
+        bits = self.inputs[self.pos]
+        self.pos += 1
+        return bits
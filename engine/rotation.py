@@ -0,0 +1,55 @@
+# engine/rotation.py
+from collections import OrderedDict
+
+import pygame
+from settings import ROTATION_STEP, ROTATION_CACHE_SIZE
+
+
+class RotationCache:
+    """
+    Pre-rotated copies of sprites at quantized angles.
+
+    Angles are snapped to multiples of `step` degrees. Frames are made
+    on first use (or up front with prebake) and kept in a bounded LRU.
+    """
+
+    def __init__(self, step=ROTATION_STEP, max_frames=ROTATION_CACHE_SIZE):
+        self.step = step
+        self.max_frames = max_frames
+        self.frames_per_turn = max(1, round(360 / step))
+        self._frames = OrderedDict()   # (image, bucket) -> rotated surface
+        self.hits = 0
+        self.misses = 0
+
+    def bucket(self, angle):
+        return round(angle / self.step) % self.frames_per_turn
+
+    def get(self, image, angle):
+        key = (image, self.bucket(angle))
+        frame = self._frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return frame
+
+        self.misses += 1
+        frame = pygame.transform.rotate(image, key[1] * self.step)
+        self._frames[key] = frame
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+        return frame
+
+    def prebake(self, image):
+        for b in range(self.frames_per_turn):
+            key = (image, b)
+            if key not in self._frames:
+                self._frames[key] = pygame.transform.rotate(image, b * self.step)
+        while len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+
+    def clear(self):
+        self._frames.clear()
+
+
+# shared fruit rotation frames
+rotations = RotationCache()
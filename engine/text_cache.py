@@ -0,0 +1,51 @@
+# engine/text_cache.py
+from collections import OrderedDict
+
+from settings import TEXT_CACHE_BYTES
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (font, text, color, antialias).
+
+    A string is only rasterized the first time it is seen; after that
+    it is a lookup. Least recently used surfaces are dropped once the
+    cache holds more than max_bytes of pixels.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        self.bytes += self._size_of(surf)
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, old = self._surfaces.popitem(last=False)
+            self.bytes -= self._size_of(old)
+        return surf
+
+    @staticmethod
+    def _size_of(surf):
+        w, h = surf.get_size()
+        return w * h * surf.get_bytesize()
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+
+
+# shared by every screen
+texts = TextCache()
@@ -0,0 +1,37 @@
+# engine/timestep.py
+from settings import SIM_HZ, MAX_CATCH_UP_STEPS
+
+
+class FixedTimestep:
+    """
+    Turns variable frame time into a whole number of fixed ticks.
+
+    advance(dt) returns how many ticks to simulate this frame. What is
+    left over stays in the accumulator; alpha (0..1) is how far we are
+    into the next tick and is used to interpolate when drawing. After a
+    long stall at most max_steps ticks are run and the rest is dropped,
+    so the game slows down briefly instead of spiralling.
+    """
+
+    def __init__(self, tick_rate=SIM_HZ, max_steps=MAX_CATCH_UP_STEPS):
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped = 0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        self.accumulator += dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = self.step * steps
+        self.accumulator -= self.step * steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step)
@@ -1,40 +1,157 @@
-import pygame
-from settings import WIDTH, HEIGHT, FPS
+import importlib
+import sys
+import time
 
-from screens.loading import LoadingScreen
-from screens.menu import MenuScreen
-from screens.gameplay import GameScreen
-from screens.game_over import GameOverScreen
+import pygame
+from settings import WIDTH, HEIGHT, RENDER_FPS, LEADERBOARD_SIZE
+from engine.display import Display
+from engine.profiler import profiler
+from engine.quality import quality
 
 
 FULLSCREEN = False
 
+# name -> (module, class); imported and built on first use
+SCREENS = {
+    "loading": ("screens.loading", "LoadingScreen"),
+    "menu": ("screens.menu", "MenuScreen"),
+    "gameplay": ("screens.gameplay", "GameScreen"),
+    "game_over": ("screens.game_over", "GameOverScreen"),
+}
+
+
+class ScreenRegistry:
+    """
+    Imports and constructs screens the first time they are needed.
+
+    release() drops a screen (calling its release() if it has one) so
+    its surfaces can be freed. Import and construction times are kept
+    in `timings` (ms) to track startup cost; run with --timings to print them.
+    """
+
+    def __init__(self, width, height, screens=SCREENS):
+        self.width = width
+        self.height = height
+        self.specs = screens
+        self.screens = {}
+        self.timings = {}
+
+    def module(self, name):
+        module_name = self.specs[name][0]
+        t0 = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self.timings.setdefault(name, {})
+        self.timings[name].setdefault("import_ms", (time.perf_counter() - t0) * 1000)
+        return module
+
+    def get(self, name, **kwargs):
+        screen = self.screens.get(name)
+        if screen is None:
+            cls = getattr(self.module(name), self.specs[name][1])
+            t0 = time.perf_counter()
+            screen = cls(self.width, self.height, **kwargs)
+            self.timings[name]["build_ms"] = (time.perf_counter() - t0) * 1000
+            self.screens[name] = screen
+        return screen
+
+    def release(self, name):
+        screen = self.screens.pop(name, None)
+        if screen is not None and hasattr(screen, "release"):
+            screen.release()
+
+    def manifest(self, *names):
+        # asset lists of screens that aren't built yet, for the loader
+        entries = []
+        for name in names:
+            module = self.module(name)
+            if hasattr(module, "asset_manifest"):
+                entries.extend(module.asset_manifest(self.width, self.height))
+        return entries
+
+    def release_all(self):
+        for name in list(self.screens):
+            self.release(name)
+
+    def report(self):
+        for name, t in self.timings.items():
+            print(f"{name:<10} import {t.get('import_ms', 0):7.1f} ms   build {t.get('build_ms', 0):7.1f} ms")
+
+
+def is_idle(screen):
+    # screens with an is_idle() only change when an event arrives
+    check = getattr(screen, "is_idle", None)
+    return check is not None and check()
+
+
+def invalidate(screen):
+    redraw = getattr(screen, "invalidate", None)
+    if redraw is not None:
+        redraw()
+
+
+def arg_value(flag):
+    # value following `flag` on the command line, or None
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
 def main():
+    # --record: write every round's inputs to REPLAY_DIR
+    # --replay FILE: play FILE back instead of reading the keyboard
+    # --autoplay [SKILL]: let the bot play (novice, average, expert)
+    replay = None
+    replay_file = arg_value("--replay")
+    if replay_file is not None:
+        from engine.replay import InputReplay
+        replay = InputReplay(replay_file)
+
+    autoplayer = None
+    if "--autoplay" in sys.argv:
+        from engine.autoplay import AutoPlayer
+        skill = arg_value("--autoplay")
+        autoplayer = AutoPlayer(skill if skill and not skill.startswith("--") else "average")
+
+    # bot and replayed rounds don't go on the leaderboard
+    leaderboard = None
+    if autoplayer is None and replay is None:
+        from engine.leaderboard import Leaderboard
+        leaderboard = Leaderboard()
+
     pygame.init()
     try:
         pygame.mixer.init()
     except pygame.error:
         pass
 
-    surface = pygame.display.set_mode((WIDTH, HEIGHT))
-    if FULLSCREEN:
-        surface = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+    # screens draw on display.canvas (always WIDTH x HEIGHT); present()
+    # scales it to whatever size the window or the screen is
+    display = Display((WIDTH, HEIGHT), fullscreen=FULLSCREEN)
     pygame.display.set_caption("Alpha Ninja")
     clock = pygame.time.Clock()
 
-    loading = LoadingScreen(WIDTH, HEIGHT)
-    menu = MenuScreen(WIDTH, HEIGHT)
-    gameplay = GameScreen(WIDTH, HEIGHT)
-    gameover = GameOverScreen(WIDTH, HEIGHT)
-
-    current = loading
+    # only the loading screen exists at first; it loads the other screens'
+    # assets in the background and they are built from the cache later
+    screens = ScreenRegistry(WIDTH, HEIGHT)
+    current = screens.get("loading", manifest=lambda: screens.manifest("menu", "gameplay"))
     current.enter()
 
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000.0  # seconds
-
-        events = pygame.event.get()
+        # render rate only; gameplay simulates in fixed ticks (see FixedTimestep)
+        dt = clock.tick(RENDER_FPS) / 1000.0  # seconds
+        # work time of the last frame (without the tick wait) drives effect quality
+        quality.record(clock.get_rawtime())
+
+        if is_idle(current) and not profiler.enabled:
+            # static screen: sleep until something happens instead of spinning
+            events = [pygame.event.wait()] + pygame.event.get()
+            clock.tick()  # don't count the wait as frame time
+            dt = 0.0
+        else:
+            events = pygame.event.get()
 
         # 1) handle events
         action = None
@@ -44,7 +161,19 @@ def main():
                 action = a
             # To toggle fullscreen mode
             if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
-                pygame.display.toggle_fullscreen()
+                display.toggle_fullscreen()
+                invalidate(current)
+            if event.type == pygame.WINDOWSIZECHANGED:
+                display.resized()
+                invalidate(current)
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                invalidate(current)
+            # F3: frame profiler overlay, F4: write recorded frames to CSV
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+                invalidate(current)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                profiler.dump_csv()
 
         # 2) update (if no action yet)
         if action is None:
@@ -55,27 +184,46 @@ def main():
             running = False
 
         elif action == "menu":
-            current = menu
+            # the loading screen is never shown again
+            screens.release("loading")
+            current = screens.get("menu")
             current.enter()
 
-        elif action == "start":
-            gameplay.enter()
-            current = gameplay
-
-        elif action == "retry":
-            gameplay.enter()
-            current = gameplay
+        elif action in ("start", "retry"):
+            current = screens.get("gameplay")
+            current.record_replays = current.record_replays or "--record" in sys.argv
+            current.autoplayer = autoplayer
+            current.leaderboard = leaderboard
+            current.enter(replay=replay)
 
         elif isinstance(action, tuple) and action[0] == "game_over":
             _, final_score, best_score = action
-            gameover.enter(final_score, best_score)
-            current = gameover
-
-        current.draw(surface)
-        pygame.display.flip()
-
+            run = current.last_run
+            top = leaderboard.top(LEADERBOARD_SIZE) if leaderboard is not None else None
+            current = screens.get("game_over")
+            current.enter(final_score, best_score, top, run)
+
+        # draw() returns None for "whole screen changed", otherwise the
+        # list of rects that did (empty: nothing to present this frame)
+        if profiler.enabled:
+            # the overlay is translucent: repaint what's under it every frame
+            invalidate(current)
+        dirty = current.draw(display.canvas)
+        if profiler.enabled:
+            profiler.draw_overlay(display.canvas)
+            dirty = None
+        with profiler.section("flip"):
+            display.present(dirty)
+        profiler.end_frame()
+
+    screens.release_all()
+    if leaderboard is not None:
+        leaderboard.close()
     pygame.quit()
 
+    if "--timings" in sys.argv:
+        screens.report()
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 import pygame
 from settings import WIDTH, HEIGHT
+from engine.animation import AnimatedSprite, pulse_frames
+from engine.text_cache import texts
 
 
 class GameOverScreen:
@@ -13,16 +15,38 @@ class GameOverScreen:
 
         self.final_score = 0
         self.best_score = None
+        # best runs (dicts from engine.leaderboard) and the one just played
+        self.top = []
+        self.current_run = None
         self._pulse_t = 0.0
 
         self.title_font = pygame.font.Font(None, 96)
         self.score_font = pygame.font.Font(None, 44)
         self.hint_font = pygame.font.Font(None, 30)
 
-    def enter(self, final_score: int, best_score: int | None = None) -> None:
+        self.bg = (12, 12, 18)
+        self._needs_redraw = True
+
+        # pulse frames are baked on the first enter(), then reused
+        self._title = None
+        self._title_area = None
+
+    def enter(self, final_score: int, best_score: int | None = None, top=None, current_run=None) -> None:
         self.final_score = int(final_score)
         self.best_score = int(best_score) if best_score is not None else None
+        self.top = list(top or ())
+        self.current_run = current_run
         self._pulse_t = 0.0
+        self._needs_redraw = True
+
+        if self._title is None:
+            # 1.5 s loop of a 3% scale pulse (was smoothscaled every frame)
+            title_surf = self.title_font.render("GAME OVER", True, (255, 70, 70))
+            self._title = AnimatedSprite(
+                pulse_frames(title_surf, 0.03, 1.5), fps=30,
+                start=(self.width // 2, self.height // 2 - 140),
+            )
+            self._title_area = self._title.bounds()
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
@@ -41,31 +65,55 @@ class GameOverScreen:
         self._pulse_t += dt
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill((12, 12, 18))
+    def invalidate(self) -> None:
+        self._needs_redraw = True
 
-        pulse = 1.0 + 0.03 * (pygame.math.Vector2(1, 0).rotate(self._pulse_t * 240).x)
-        title_surf = self.title_font.render("GAME OVER", True, (255, 70, 70))
-        title_surf = pygame.transform.smoothscale(
-            title_surf,
-            (int(title_surf.get_width() * pulse), int(title_surf.get_height() * pulse)),
-        )
+    def draw(self, surface: pygame.Surface):
+        # only the pulsing title changes between frames; everything else is
+        # drawn once after enter() and the title area is patched after that
+        if not self._needs_redraw:
+            surface.fill(self.bg, self._title_area)
+            self._draw_title(surface)
+            return [self._title_area]
 
-        surface.blit(title_surf, title_surf.get_rect(center=(self.width // 2, self.height // 2 - 140)))
+        surface.fill(self.bg)
+        self._draw_title(surface)
 
-        score_surf = self.score_font.render(f"Score: {self.final_score}", True, (230, 230, 240))
+        score_surf = texts.render(self.score_font, f"Score: {self.final_score}", (230, 230, 240))
         surface.blit(score_surf, score_surf.get_rect(center=(self.width // 2, self.height // 2 - 35)))
 
         if self.best_score is not None:
-            best_surf = self.score_font.render(f"Best: {self.best_score}", True, (180, 210, 255))
+            best_surf = texts.render(self.score_font, f"Best: {self.best_score}", (180, 210, 255))
             surface.blit(best_surf, best_surf.get_rect(center=(self.width // 2, self.height // 2 + 10)))
 
+        if self.top:
+            self._draw_top(surface)
+
         hints = ["R  - Retry (slice again!)", "M - Back to Menu", "Q / ESC - Quit"]
         y = self.height // 2 + 100
         for line in hints:
-            hint_surf = self.hint_font.render(line, True, (170, 170, 185))
+            hint_surf = texts.render(self.hint_font, line, (170, 170, 185))
             surface.blit(hint_surf, hint_surf.get_rect(center=(self.width // 2, y)))
             y += 36
 
-        footer = self.hint_font.render("Ninja Cutter — sharpen your reflexes.", True, (120, 120, 135))
+        footer = texts.render(self.hint_font, "Ninja Cutter — sharpen your reflexes.", (120, 120, 135))
         surface.blit(footer, footer.get_rect(center=(self.width // 2, self.height - 40)))
+
+        self._needs_redraw = False
+        return None
+
+    def _draw_top(self, surface: pygame.Surface) -> None:
+        x = self.width - 200
+        y = self.height // 2 - 60
+        head = texts.render(self.hint_font, "TOP SCORES", (255, 215, 0))
+        surface.blit(head, (x, y))
+        for i, run in enumerate(self.top, 1):
+            y += 30
+            color = (255, 235, 140) if run is self.current_run else (200, 200, 215)
+            surface.blit(texts.render(self.hint_font, f"{i}.", color), (x, y))
+            score = texts.render(self.hint_font, str(run["score"]), color)
+            surface.blit(score, score.get_rect(topright=(x + 100, y)))
+            surface.blit(texts.render(self.hint_font, f"Lv {run['level']}", color), (x + 120, y))
+
+    def _draw_title(self, surface: pygame.Surface) -> None:
+        self._title.draw(surface, self._pulse_t)
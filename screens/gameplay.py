@@ -3,7 +3,20 @@ import random
 import math
 import array
 import os
-from settings import WIDTH, HEIGHT
+from settings import WIDTH, HEIGHT, GAMEPLAY_BACKGROUND, RECORD_REPLAYS, SIM_HZ, SLICE_MIN_INTERVAL_MS
+from engine.assets import assets
+from engine.audio import audio
+from engine.background import BACKGROUND_IMAGES, BackgroundLayers, background_path
+from engine.broadphase import RowGrid
+from engine.collision import BladeSweep
+from engine.particles import ParticleSystem
+from engine.pool import EntityList
+from engine.profiler import profiler
+from engine.quality import quality
+from engine.replay import InputRecorder, KeyState, encode_keys, replay_path
+from engine.rotation import rotations
+from engine.text_cache import texts
+from engine.timestep import FixedTimestep
 
 
 # ------------------ PATHS ------------------
@@ -25,16 +38,34 @@ GOLD = (255, 215, 0)
 
 # ------------------ GAME DIFFICULTY ------------------
 class DifficultyManager:
-    def __init__(self):
+    def __init__(self, rng=random, **params):
+        self.rng = rng
+        self.reset(**params)
+
+    def reset(self, **params):
+        # back to level 1 with the default tuning, plus any overrides
         self.level = 1
         self.score_threshold = 100
         self.base_spawn_rate = 50
+        self.min_spawn_rate = 20
+        self.spawn_rate_step = 3
         self.base_fruit_speed = (3, 6)
+        self.fruit_speed_step = 0.5
 
         # Bomb difficulty tuning
         self.base_bomb_interval = 180
         self.min_bomb_interval = 60
+        self.bomb_interval_step = 10
         self.base_bomb_speed = (3.0, 5.0)
+        self.bomb_speed_step = 0.35
+        # (from level, chance of 3 bombs, chance of 2 bombs), highest level first
+        self.bomb_bursts = ((7, 0.20, 0.35), (4, 0.0, 0.35))
+
+        # any of the above can be overridden (see tools/sweep.py)
+        for name, value in params.items():
+            if not hasattr(self, name):
+                raise TypeError(f"unknown difficulty parameter {name!r}")
+            setattr(self, name, value)
 
     def update(self, score):
         new_level = score // self.score_threshold + 1
@@ -44,35 +75,34 @@ class DifficultyManager:
         return False
 
     def get_spawn_rate(self):
-        return max(20, self.base_spawn_rate - self.level * 3)
+        return max(self.min_spawn_rate, self.base_spawn_rate - self.level * self.spawn_rate_step)
 
     def get_fruit_speed(self):
-        min_speed = self.base_fruit_speed[0] + self.level * 0.5
-        max_speed = self.base_fruit_speed[1] + self.level * 0.5
+        min_speed = self.base_fruit_speed[0] + self.level * self.fruit_speed_step
+        max_speed = self.base_fruit_speed[1] + self.level * self.fruit_speed_step
         return (min_speed, max_speed)
 
     # ✅ Bombs fall faster with level
     def get_bomb_speed(self):
-        min_speed = self.base_bomb_speed[0] + self.level * 0.35
-        max_speed = self.base_bomb_speed[1] + self.level * 0.35
+        min_speed = self.base_bomb_speed[0] + self.level * self.bomb_speed_step
+        max_speed = self.base_bomb_speed[1] + self.level * self.bomb_speed_step
         return (min_speed, max_speed)
 
     # ✅ Bombs spawn more often with level
     def get_bomb_interval(self):
-        interval = self.base_bomb_interval - self.level * 10
+        interval = self.base_bomb_interval - self.level * self.bomb_interval_step
         return max(self.min_bomb_interval, interval)
 
     # ✅ Spawn multiple bombs sometimes (burst)
     def get_bomb_burst_count(self):
-        roll = random.random()
-        if self.level >= 7:
-            if roll < 0.20:
-                return 3
-            if roll < 0.55:
-                return 2
-            return 1
-        if self.level >= 4:
-            return 2 if roll < 0.35 else 1
+        roll = self.rng.random()
+        for level, three, two in self.bomb_bursts:
+            if self.level >= level:
+                if roll < three:
+                    return 3
+                if roll < three + two:
+                    return 2
+                return 1
         return 1
 
 
@@ -84,6 +114,7 @@ FRUIT_TYPES = {
     "orange": {"color": (255, 165, 0), "inner": (255, 200, 100), "size": 48, "points": 9},
     "strawberry": {"color": (255, 50, 80), "inner": (255, 150, 150), "size": 40, "points": 7},
 }
+FRUIT_NAMES = list(FRUIT_TYPES)
 
 # ------------------ FRUIT IMAGES ------------------
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -96,69 +127,175 @@ def load_fruit_images():
     for fruit, info in FRUIT_TYPES.items():
         path = os.path.join(ASSET_DIR, f"{fruit}.png")
         if os.path.exists(path):
-            image = pygame.image.load(path).convert_alpha()
             size = info["size"]
-            FRUIT_IMAGES[fruit] = pygame.transform.smoothscale(
-                image, (size, size)
-            )
+            FRUIT_IMAGES[fruit] = assets.image(path, (size, size))
+            rotations.prebake(FRUIT_IMAGES[fruit])
         else:
             FRUIT_IMAGES[fruit] = None
 
 
+def asset_manifest(width=WIDTH, height=HEIGHT):
+    # everything GameScreen loads, for the background loader
+    entries = []
+    for fruit, info in FRUIT_TYPES.items():
+        path = os.path.join(ASSET_DIR, f"{fruit}.png")
+        if os.path.exists(path):
+            entries.append(("image", path, (info["size"], info["size"]), True))
+    entries.append(("image", os.path.join(ASSET_DIR, "heart.png"), (32, 32), True))
+    # every background B can switch to, the starting one first
+    names = sorted(BACKGROUND_IMAGES, key=lambda name: name != GAMEPLAY_BACKGROUND)
+    for name in names:
+        entries.append(("image", background_path(name), (width, height), False))
+    for path in (SND_SLICE, SND_GAME_START, SND_GAME_OVER):
+        entries.append(("sound", path))
+    return entries
+
+
+# ------------------ BOMB / POWER-UP SPRITES ------------------
+# Baked once by load_sprites() so drawing a bomb or power-up is one
+# blit. Angles snap to the rotation cache's buckets like fruit do.
+SPRITE_KEY = (255, 0, 255)
+SPARK_COLORS = ((255, 200, 0), (255, 100, 0), (255, 0, 0))
+SPARK_VARIANTS = 3
+# a five-point star looks the same every 72 degrees
+STAR_FRAMES = rotations.frames_per_turn // math.gcd(rotations.frames_per_turn, 5)
+
+BOMB_SPRITES = []       # [angle bucket] -> [no sparks, spark variants...]
+BOMB_ANCHOR = (0, 0)    # sprite pixel that goes on the bomb's centre
+POWERUP_SPRITES = {}    # type -> [angle bucket] -> [(frame, ox, oy) no glow, glow 0, 2 .. 20]
+
+
+def draw_bomb(surface, x, y, size, angle, sparks=()):
+    # sparks: one (dx, dy) jitter per spark colour
+    pygame.draw.circle(surface, (30, 30, 30), (x, y), size // 2)
+    pygame.draw.circle(surface, (60, 60, 60), (x - 5, y - 5), size // 6)
+
+    fuse_length = 15
+    fuse_x = x + (size // 2) * math.cos(math.radians(angle))
+    fuse_y = y - (size // 2) * math.sin(math.radians(angle))
+    pygame.draw.line(surface, (139, 69, 19), (x, y - size // 2), (fuse_x, fuse_y - fuse_length), 3)
+
+    for i, ((dx, dy), color) in enumerate(zip(sparks, SPARK_COLORS)):
+        pygame.draw.circle(surface, color, (int(fuse_x + dx), int(fuse_y - fuse_length + dy)), 4 - i)
+
+    pygame.draw.circle(surface, (255, 0, 0), (x, y), size // 2, 2)
+
+
+def draw_powerup(surface, x, y, size, angle, color, icon, glow=None):
+    if glow is not None:
+        for i in range(3):
+            pygame.draw.circle(surface, color, (x, y), (size + glow + i * 5) // 2, 2)
+
+    points = []
+    for i in range(10):
+        radius = size // 2 if i % 2 == 0 else size // 4
+        a = math.radians(i * 36 + angle)
+        points.append((x + radius * math.cos(a), y + radius * math.sin(a)))
+    pygame.draw.polygon(surface, color, points)
+    surface.blit(icon, icon.get_rect(center=(x, y)))
+
+
+def load_sprites(tiny_font, bomb_size=40, powerup_size=35):
+    global BOMB_ANCHOR
+    if BOMB_SPRITES:
+        return
+    step = rotations.step
+    # fixed jitter, so the sheet is the same every run
+    jitter = random.Random(0)
+
+    # fuse tip up to size // 2 + 15 above the centre, sparks 6 px past it
+    reach = bomb_size // 2 + 7
+    cx, cy = reach, bomb_size // 2 + 15 + 7
+    for bucket in range(rotations.frames_per_turn):
+        variants = [()] + [
+            [(jitter.randint(-2, 2), jitter.randint(-2, 2)) for _ in SPARK_COLORS]
+            for _ in range(SPARK_VARIANTS)
+        ]
+        frames = []
+        for sparks in variants:
+            # colour key, not per-pixel alpha: pygame.draw doesn't antialias
+            frame = pygame.Surface((2 * reach, cy + reach)).convert()
+            frame.fill(SPRITE_KEY)
+            draw_bomb(frame, cx, cy, bomb_size, bucket * step, sparks)
+            frame.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+            frames.append(frame)
+        BOMB_SPRITES.append(frames)
+    BOMB_ANCHOR = (cx, cy)
+
+    for kind in PowerUp.types:
+        color = PowerUp.colors[kind]
+        icon = texts.render(tiny_font, PowerUp.icons[kind], WHITE)
+        core = max(powerup_size // 2, icon.get_width() // 2, icon.get_height() // 2) + 1
+        sheet = []
+        for bucket in range(STAR_FRAMES):
+            frames = []
+            for glow in (None,) + tuple(range(0, 21, 2)):
+                half = core if glow is None else max(core, (powerup_size + glow + 10) // 2 + 1)
+                # per-pixel alpha for the antialiased label
+                frame = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+                draw_powerup(frame, half, half, powerup_size, bucket * step, color, icon, glow)
+                frame = frame.convert_alpha()
+                frame.set_alpha(255, pygame.RLEACCEL)   # skips the clear pixels around the rings
+                frames.append((frame, half, half))
+            sheet.append(frames)
+        POWERUP_SPRITES[kind] = sheet
+
+
 class Bomb:
-    def __init__(self, speed_range=(3.0, 5.0)):
-        self.x = random.randint(50, WIDTH - 50)
+    __slots__ = ("x", "y", "prev_y", "size", "speed", "rotation", "rotation_speed", "sliced", "slot")
+
+    def __init__(self, speed_range=(3.0, 5.0), rng=random):
+        self.reset(speed_range, rng)
+
+    def reset(self, speed_range=(3.0, 5.0), rng=random):
+        self.x = rng.randint(50, WIDTH - 50)
         self.y = -40
+        self.prev_y = self.y
         self.size = 40
-        self.speed = random.uniform(speed_range[0], speed_range[1])
+        self.speed = rng.uniform(speed_range[0], speed_range[1])
         self.rotation = 0
-        self.rotation_speed = random.uniform(-5, 5)
+        self.rotation_speed = rng.uniform(-5, 5)
         self.sliced = False
 
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         self.rotation += self.rotation_speed
 
-    def draw(self, surface):
-        pygame.draw.circle(surface, (30, 30, 30), (int(self.x), int(self.y)), self.size // 2)
-        pygame.draw.circle(surface, (60, 60, 60), (int(self.x - 5), int(self.y - 5)), self.size // 6)
+    def draw(self, surface, alpha=1.0):
+        # alpha blends the previous and current tick for smooth rendering
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        frames = BOMB_SPRITES[rotations.bucket(self.rotation)]
+        # spark flicker is cosmetic, so the global random is fine here
+        frame = frames[random.randint(1, SPARK_VARIANTS)] if quality.bomb_sparks else frames[0]
+        surface.blit(frame, (int(self.x) - BOMB_ANCHOR[0], int(y) - BOMB_ANCHOR[1]))
 
-        fuse_length = 15
-        fuse_angle = self.rotation
-        fuse_x = self.x + (self.size // 2) * math.cos(math.radians(fuse_angle))
-        fuse_y = self.y - (self.size // 2) * math.sin(math.radians(fuse_angle))
-        pygame.draw.line(surface, (139, 69, 19), (self.x, self.y - self.size // 2), (fuse_x, fuse_y - fuse_length), 3)
 
-        spark_colors = [(255, 200, 0), (255, 100, 0), (255, 0, 0)]
-        for i, color in enumerate(spark_colors):
-            pygame.draw.circle(
-                surface,
-                color,
-                (int(fuse_x + random.randint(-2, 2)), int(fuse_y - fuse_length + random.randint(-2, 2))),
-                4 - i,
-            )
-
-        pygame.draw.circle(surface, (255, 0, 0), (int(self.x), int(self.y)), self.size // 2, 2)
+class PowerUp:
+    __slots__ = ("type", "x", "y", "prev_y", "size", "speed", "rotation", "sliced",
+                 "glow", "glow_direction", "slot")
 
-    def get_rect(self):
-        return pygame.Rect(self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
+    types = ["double_points", "frenzy"]
+    colors = {"double_points": GOLD, "frenzy": PURPLE}
+    icons = {"double_points": "x2", "frenzy": "Z"}
 
+    def __init__(self, rng=random):
+        self.reset(rng)
 
-class PowerUp:
-    def __init__(self, tiny_font):
-        self.types = ["double_points", "frenzy"]
-        self.type = random.choice(self.types)
-        self.x = random.randint(50, WIDTH - 50)
+    def reset(self, rng=random):
+        self.type = rng.choice(self.types)
+        self.x = rng.randint(50, WIDTH - 50)
         self.y = -40
+        self.prev_y = self.y
         self.size = 35
-        self.speed = random.uniform(2, 4)
+        self.speed = rng.uniform(2, 4)
         self.rotation = 0
         self.sliced = False
         self.glow = 0
         self.glow_direction = 1
-        self.tiny_font = tiny_font
 
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         self.rotation += 3
         self.glow += self.glow_direction * 2
@@ -166,169 +303,98 @@ class PowerUp:
             self.glow_direction *= -1
 
     def get_color(self):
-        if self.type == "double_points":
-            return GOLD
-        return PURPLE
+        return self.colors[self.type]
 
-    def draw(self, surface):
-        for i in range(3):
-            size = self.size + self.glow + i * 5
-            pygame.draw.circle(surface, self.get_color(), (int(self.x), int(self.y)), size // 2, 2)
-
-        points = []
-        for i in range(10):
-            angle = i * 36 + self.rotation
-            radius = self.size // 2 if i % 2 == 0 else self.size // 4
-            px = self.x + radius * math.cos(math.radians(angle))
-            py = self.y + radius * math.sin(math.radians(angle))
-            points.append((px, py))
-        pygame.draw.polygon(surface, self.get_color(), points)
-
-        icon = "x2" if self.type == "double_points" else "Z"
-        text = self.tiny_font.render(icon, True, WHITE)
-        surface.blit(text, text.get_rect(center=(int(self.x), int(self.y))))
-
-    def get_rect(self):
-        return pygame.Rect(self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
-
-
-def draw_background(surface, t_ms):
-    for i in range(HEIGHT):
-        ratio = i / HEIGHT
-        phase = math.sin(t_ms * 0.001) * 20
-        r = int(40 + ratio * 80 + phase)
-        g = int(20 + ratio * 50 + phase)
-        b = int(60 + ratio * 80 + phase)
-        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
-
-    points = [
-        (0, HEIGHT // 2 + 80),
-        (150, HEIGHT // 2 - 20),
-        (300, HEIGHT // 2 + 60),
-        (450, HEIGHT // 2 - 40),
-        (600, HEIGHT // 2 + 40),
-        (WIDTH, HEIGHT // 2 + 20),
-        (WIDTH, HEIGHT),
-        (0, HEIGHT),
-    ]
-    pygame.draw.polygon(surface, (30, 20, 50), points)
-
-    pygame.draw.rect(surface, (20, 15, 35), (650, HEIGHT // 2 + 50, 30, 80))
-    pygame.draw.polygon(surface, (20, 15, 35), [(630, HEIGHT // 2 + 50), (665, HEIGHT // 2 + 30), (700, HEIGHT // 2 + 50)])
-
-    pygame.draw.line(surface, (60, 40, 30), (0, 100), (200, 180), 8)
-    for pos in [(50, 90), (120, 110), (170, 100)]:
-        offset = math.sin(t_ms * 0.003 + pos[0]) * 3
-        pygame.draw.circle(surface, (255, 182, 193), (pos[0], int(pos[1] + offset)), 8)
-
-
-class Particle:
-    def __init__(self, x, y, color, particle_type="splash"):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 6) if particle_type == "splash" else random.uniform(4, 10)
-        self.x = x
-        self.y = y
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed - random.uniform(1, 3)
-        self.color = color
-        self.size = random.randint(3, 8) if particle_type == "splash" else random.randint(5, 12)
-        self.lifetime = 60 if particle_type == "splash" else 90
-        self.max_lifetime = self.lifetime
-        self.type = particle_type
+    def draw(self, surface, alpha=1.0):
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        frames = POWERUP_SPRITES[self.type][rotations.bucket(self.rotation) % STAR_FRAMES]
+        # glow runs 0..20 in steps of 2
+        frame, ox, oy = frames[1 + self.glow // 2] if quality.powerup_glow else frames[0]
+        surface.blit(frame, (int(self.x) - ox, int(y) - oy))
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.3 if self.type == "splash" else 0.5
-        self.lifetime -= 1
-        self.size = max(1, self.size - 0.1)
 
-    def draw(self, surface):
-        if self.lifetime <= 0:
-            return
-        alpha_ratio = self.lifetime / self.max_lifetime
-        color = tuple(int(c * alpha_ratio) for c in self.color)
-        if self.type == "explosion":
-            pygame.draw.circle(surface, (255, 150, 0), (int(self.x), int(self.y)), int(self.size) + 2)
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(self.size))
+class Fruit:
+    __slots__ = ("type", "info", "size", "image", "points", "x", "y", "prev_y", "speed",
+                 "rotation", "rotation_speed", "sliced", "is_critical", "small_font",
+                 "slot")
 
+    def __init__(self, speed_range, small_font, rng=random):
+        self.reset(speed_range, small_font, rng)
 
-class Fruit:
-    def __init__(self, speed_range, small_font):
-        self.type = random.choice(list(FRUIT_TYPES.keys()))
+    def reset(self, speed_range, small_font, rng=random):
+        self.type = rng.choice(FRUIT_NAMES)
         self.info = FRUIT_TYPES[self.type]
         self.size = self.info["size"]
-        # Load and scale the image
-        self.image = pygame.image.load(os.path.join(ASSET_DIR, f"{self.type}.png")).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.size, self.size))
+        # already decoded + scaled by load_fruit_images()
+        self.image = FRUIT_IMAGES.get(self.type)
 
-        self.size = self.info["size"]
         self.points = self.info["points"]
 
-        self.x = random.randint(self.size, WIDTH - self.size)
+        self.x = rng.randint(self.size, WIDTH - self.size)
         self.y = -self.size
-        self.speed = random.uniform(speed_range[0], speed_range[1])
+        self.prev_y = self.y
+        self.speed = rng.uniform(speed_range[0], speed_range[1])
 
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-3, 3)
+        self.rotation = rng.uniform(0, 360)
+        self.rotation_speed = rng.uniform(-3, 3)
 
         self.sliced = False
-        self.is_critical = random.random() < 0.1
+        self.is_critical = rng.random() < 0.1
         self.small_font = small_font
 
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         self.rotation += self.rotation_speed
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        x, y = self.x, self.prev_y + (self.y - self.prev_y) * alpha
         offset = abs(math.sin(math.radians(self.rotation))) * 3
 
         # glow for critical fruit
-        if self.is_critical:
+        if self.is_critical and quality.critical_glow:
             for i in range(3):
                 glow_size = self.size + 10 + i * 5
                 pygame.draw.circle(
                     surface, GOLD,
-                    (int(self.x), int(self.y + offset)),
+                    (int(x), int(y + offset)),
                     glow_size // 2, 1
                 )
 
         if self.image:
-            rotated = pygame.transform.rotate(self.image, self.rotation)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y + offset)))
+            rotated = rotations.get(self.image, self.rotation)
+            rect = rotated.get_rect(center=(int(x), int(y + offset)))
             surface.blit(rotated, rect)
         else:
             # fallback if image missing
             pygame.draw.circle(
                 surface,
                 self.info["color"],
-                (int(self.x), int(self.y + offset)),
+                (int(x), int(y + offset)),
                 self.size // 2
             )
 
         points_value = self.points * 2 if self.is_critical else self.points
         label_color = GOLD if self.is_critical else WHITE
-        points_text = self.small_font.render(f"+{points_value}", True, label_color)
+        points_text = texts.render(self.small_font, f"+{points_value}", label_color)
         surface.blit(
             points_text,
             points_text.get_rect(
-                center=(int(self.x), int(self.y + self.size // 2 + 15))
+                center=(int(x), int(y + self.size // 2 + 15))
             )
         )
 
-    def get_rect(self):
-        return pygame.Rect(
-            self.x - self.size // 2,
-            self.y - self.size // 2,
-            self.size,
-            self.size
-        )
-
 
 
 class Ninja:
     def __init__(self):
+        self.slash_rect = pygame.Rect(0, 0, 120, 15)
+        self.prev_slash_rect = pygame.Rect(0, 0, 120, 15)
+        self.reset()
+
+    def reset(self):
         self.x = WIDTH // 2
+        self.prev_x = self.x
         self.y = HEIGHT - 100
         self.width = 60
         self.height = 80
@@ -341,6 +407,9 @@ class Ninja:
         self.dash_direction = 0
 
     def update(self, keys):
+        self.prev_x = self.x
+        # where the blade was at the end of the last tick (for swept hits)
+        self.prev_slash_rect.update(self.get_slash_area())
         if keys[pygame.K_LEFT] and self.x > self.width // 2:
             self.x -= self.speed
         if keys[pygame.K_RIGHT] and self.x < WIDTH - self.width // 2:
@@ -378,8 +447,9 @@ class Ninja:
     def trigger_slash(self):
         self.is_slashing = True
 
-    def draw(self, surface):
-        x, y = int(self.x), int(self.y)
+    def draw(self, surface, alpha=1.0):
+        x = int(self.prev_x + (self.x - self.prev_x) * alpha)
+        y = int(self.y)
         pygame.draw.ellipse(surface, (50, 50, 50), (x - 30, y + 60, 60, 15))
         pygame.draw.circle(surface, (30, 30, 40), (x, y - 25), 18)
         pygame.draw.rect(surface, (180, 0, 0), (x - 20, y - 30, 40, 10))
@@ -415,17 +485,21 @@ class Ninja:
         width = 120
         height = 15   # half the original height
 
-        return pygame.Rect(
-            center_x - width // 2,
-            center_y - height // 2,
-            width,
-            height
-        )
+        # one rect per ninja, moved in place
+        rect = self.slash_rect
+        rect.x = int(center_x - width // 2)
+        rect.y = int(center_y - height // 2)
+        return rect
 
 
 
 class FloatingText:
+    __slots__ = ("x", "y", "text", "color", "lifetime", "vy", "font", "slot")
+
     def __init__(self, x, y, text, color, font):
+        self.reset(x, y, text, color, font)
+
+    def reset(self, x, y, text, color, font):
         self.x = x
         self.y = y
         self.text = text
@@ -438,18 +512,22 @@ class FloatingText:
         self.y += self.vy
         self.lifetime -= 1
 
-    def draw(self, surface):
-        surface.blit(self.font.render(self.text, True, self.color), (int(self.x), int(self.y)))
+    def draw(self, surface, alpha=1.0):
+        x, y = self.x, self.y - self.vy * (1.0 - alpha)
+        surface.blit(texts.render(self.font, self.text, self.color), (int(x), int(y)))
 
 
 # ------------------ SOUND MANAGER (simple) ------------------
 
 class SoundBank:
+    """Gameplay sounds, played through the shared engine.audio manager."""
+
     def __init__(self):
-        self.ok = False
-        self.slice = None
-        self.start = None
-        self.over = None
+        # clips are decoded once per process; later SoundBanks just look them up
+        self.ok = audio.available()
+        self.slice = audio.load("slice", SND_SLICE, 0.35, SLICE_MIN_INTERVAL_MS)   # 🔽 much lower
+        self.start = audio.load("game_start", SND_GAME_START, 0.6)
+        self.over = audio.load("game_over", SND_GAME_OVER, 0.7)
         self.bg_loaded = False
 
         # ✅ keep channel references
@@ -457,72 +535,42 @@ class SoundBank:
         self._over_channel = None
         self._intro_channel = None
 
-        try:
-            if pygame.mixer.get_init():
-                self.ok = True
-                self.slice = pygame.mixer.Sound(SND_SLICE)
-                self.slice.set_volume(0.35)   # 🔽 much lower
-                self.start = pygame.mixer.Sound(SND_GAME_START)
-                self.start.set_volume(0.6)
-                self.over = pygame.mixer.Sound(SND_GAME_OVER)
-                self.over.set_volume(0.7)
-        except Exception:
-            self.ok = False
-
     def play_slice(self):
-        if self.ok and self.slice:
-            self.slice.play()
+        audio.play("slice", "slice")
 
     def play_start(self):
-        if self.ok and self.start:
-            # ✅ stop intro and gameover first if they're still playing
-            self.stop_intro()
-            self.stop_game_over()
-            # ✅ play once (no loops), keep channel so we can stop it
-            self._start_channel = self.start.play(loops=0)
+        # ✅ stop intro and gameover first if they're still playing
+        self.stop_intro()
+        self.stop_game_over()
+        # ✅ play once (no loops), keep channel so we can stop it
+        self._start_channel = audio.play("game_start", "stinger")
 
     def stop_start(self):
         # ✅ stops the start sound immediately (if still playing)
-        if self._start_channel:
-            self._start_channel.stop()
-            self._start_channel = None
+        audio.stop(self._start_channel, "game_start")
+        self._start_channel = None
 
     def play_intro(self):
-        if self.ok and self.start:
-            # ✅ keep channel reference so we can stop it later
-            self._intro_channel = self.start.play(loops=-1)
+        self._intro_channel = audio.play("game_start", "stinger", loops=-1)
 
     def stop_intro(self):
-        # ✅ stops the intro sound immediately (if still playing)
-        if self._intro_channel:
-            self._intro_channel.stop()
-            self._intro_channel = None
+        audio.stop(self._intro_channel, "game_start")
+        self._intro_channel = None
 
     def play_game_over(self):
-        if self.ok and self.over:
-            # ✅ keep channel reference so we can stop it later
-            self._over_channel = self.over.play()
+        self._over_channel = audio.play("game_over", "stinger")
 
     def stop_game_over(self):
-        # ✅ stops the gameover sound immediately (if still playing)
-        if self._over_channel:
-            self._over_channel.stop()
-            self._over_channel = None
+        audio.stop(self._over_channel, "game_over")
+        self._over_channel = None
 
     def start_bg(self, volume=0.35):
-        if not self.ok:
-            return
-        try:
-            pygame.mixer.music.load(SND_BG_GAMEPLAY)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)
-            self.bg_loaded = True
-        except Exception:
-            self.bg_loaded = False
+        # stays loaded between rounds; a missing file is only tried once
+        self.bg_loaded = audio.play_music(SND_BG_GAMEPLAY, volume)
 
     def stop_bg(self):
-        if self.ok and self.bg_loaded:
-            pygame.mixer.music.stop()
+        if self.bg_loaded:
+            audio.stop_music()
             self.bg_loaded = False
 
 
@@ -537,36 +585,98 @@ class GameScreen:
 
         # hearts
         heart_path = os.path.join(ASSET_DIR, "heart.png")
-        self.heart_image = pygame.image.load(heart_path).convert_alpha()
-        self.heart_image = pygame.transform.smoothscale(self.heart_image, (32, 32))
+        self.heart_image = assets.image(heart_path, (32, 32))
+
+        # static background parts are baked once here (B cycles backgrounds)
+        self.background = BackgroundLayers(width, height, GAMEPLAY_BACKGROUND)
 
 
         self.sounds = SoundBank()
 
         self.best_score = 0
 
-        load_fruit_images()   #  LOAD FIRST
-        self.enter()          #  THEN CREATE FRUITS
-
-
+        # pooled entity containers, reused by every round
+        self.fruits = EntityList(Fruit)
+        self.bombs = EntityList(Bomb)
+        self.powerups = EntityList(PowerUp)
+        self.floating_texts = EntityList(FloatingText)
+        self.particles = ParticleSystem()
+
+        # broadphase rows: only entities near the slash band get swept tests
+        self.fruit_grid = RowGrid(height)
+        self.bomb_grid = RowGrid(height)
+        self.powerup_grid = RowGrid(height)
+        self.blade = BladeSweep()
+        self.query_reach = 0
+
+        # simulation ticks at SIM_HZ no matter how fast we render
+        self.timestep = FixedTimestep()
+
+        # everything the simulation rolls comes from this per-round RNG,
+        # so a seed plus the per-tick inputs reproduce a round exactly
+        self.rng = random.Random()
+        self.seed = None
+        self.keys = KeyState()
+        self.replay = None
+        # an engine.autoplay.AutoPlayer here plays instead of the keyboard
+        self.autoplayer = None
+        # DifficultyManager overrides for every round
+        self.difficulty_params = {}
+        # an engine.leaderboard.Leaderboard here stores each finished run
+        self.leaderboard = None
+        self.last_run = None
+        self.recorder = None
+        self.record_replays = RECORD_REPLAYS
+        self._pause_toggled = False
+
+        # per-round state lives in these; reset_round() resets them in place
+        self.ninja = Ninja()
+        self.difficulty = DifficultyManager(self.rng)
+        self.active_powerups = {"double_points": 0, "frenzy": 0}
+        self.stats = {"fruits_sliced": 0, "bombs_hit": 0, "critical_hits": 0, "powerups_collected": 0}
         self.max_bomb_hits = 3
-        self.enter()
 
-    def enter(self):
+        load_fruit_images()
+        load_sprites(self.tiny_font)
+        # a valid (silent) round until enter() starts a real one
+        self._start_sound_cut_done = True
+        self.reset_round()
+
+    def enter(self, seed=None, replay=None):
+        # replay: an InputReplay to play back instead of the keyboard
+        self.stop_recording()
+        self.replay = replay
+        if replay is not None:
+            replay.rewind()
+            seed = replay.seed
+        elif seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.particles.seed(seed)
+        if self.autoplayer is not None:
+            self.autoplayer.reset(seed)
+        if self.record_replays and replay is None:
+            self.recorder = InputRecorder(replay_path(seed), seed)
+        self._pause_toggled = False
+
         # sounds: start gameplay
         self.sounds.play_start()
         self.sounds.start_bg(volume=0.35)
         self._start_sound_cut_done = False
 
+        self.reset_round()
 
-        self.fruits = []
-        self.bombs = []
-        self.powerups = []
-        self.particles = []
-        self.floating_texts = []
+    def reset_round(self):
+        # only counters and state: containers, pools, images and sounds are kept
+        self.fruits.clear()
+        self.bombs.clear()
+        self.powerups.clear()
+        self.particles.clear()
+        self.floating_texts.clear()
 
-        self.ninja = Ninja()
-        self.difficulty = DifficultyManager()
+        self.ninja.reset()
+        self.difficulty.reset(**self.difficulty_params)
 
         self.spawn_timer = 0
         self.bomb_spawn_timer = 0
@@ -579,10 +689,13 @@ class GameScreen:
         self.bomb_hits = 0
 
         self.game_time_ms = 0
+        self.ticks = 0
         self.paused = False
+        self.timestep.reset()
 
-        self.active_powerups = {"double_points": 0, "frenzy": 0}
-        self.stats = {"fruits_sliced": 0, "bombs_hit": 0, "critical_hits": 0, "powerups_collected": 0}
+        for counters in (self.active_powerups, self.stats):
+            for k in counters:
+                counters[k] = 0
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
@@ -592,6 +705,9 @@ class GameScreen:
                 return "quit"
             if event.key == pygame.K_p:
                 self.paused = not self.paused
+                self._pause_toggled = True
+            if event.key == pygame.K_b:
+                self.background.cycle()
         return None
 
     def update(self, dt):
@@ -599,30 +715,94 @@ class GameScreen:
 
         if self.paused:
             return None
+
+        for _ in range(self.timestep.advance(dt)):
+            action = self.tick()
+            if action is not None:
+                return action
+        return None
+
+    def tick(self):
+        # one fixed simulation step; all per-tick counters assume SIM_HZ
         if not self._start_sound_cut_done:
             self.sounds.stop_start()
             self._start_sound_cut_done = True
 
         #  Game over only by bombs
         if self.bomb_hits >= self.max_bomb_hits:
+            return self.game_over()
+
+        self.ticks += 1
+        keys = self.keys
+        if self.replay is not None:
+            bits = self.replay.next_tick()
+            if bits is None:
+                # recording ended (the player quit mid-round)
+                return self.game_over()
+            keys.bits = bits
+        elif self.autoplayer is not None:
+            keys.bits = self.autoplayer.decide(self)
+        else:
+            keys.bits = encode_keys(pygame.key.get_pressed(), self._pause_toggled)
+            self._pause_toggled = False
+        if self.recorder is not None:
+            self.recorder.record(keys.bits)
+        self.ninja.update(keys)
+
+        with profiler.section("spawn"):
+            self._spawn()
+
+        # swept blade: covers everything between last tick and this one
+        blade = self.blade
+        blade.set(self.ninja.prev_slash_rect, self.ninja.get_slash_area())
+        # entities are bucketed by their current y; anything that fell
+        # through the band this tick can be at most one step below it
+        self.query_reach = max(self.difficulty.get_fruit_speed()[1], self.difficulty.get_bomb_speed()[1], 4) + 1
+
+        with profiler.section("fruits"):
+            self._update_fruits(blade)
+        with profiler.section("bombs"):
+            self._update_bombs(blade)
+        with profiler.section("powerups"):
+            self._update_powerups(blade)
+        with profiler.section("particles"):
+            self._update_effects()
+
+        return None
+
+    def game_over(self):
+        self.stop_recording()
+        if self.replay is None:
             self.best_score = max(self.best_score, self.score)
+            if self.leaderboard is not None:
+                self.last_run = self.leaderboard.record(
+                    self.score, self.difficulty.level, self.max_combo,
+                    self.ticks * 1000 // SIM_HZ, self.stats, self.seed,
+                )
+                self.best_score = max(self.best_score, self.leaderboard.best())
 
-            # stop bg + play game over
-            self.sounds.stop_bg()
-            self.sounds.play_game_over()
+        # stop bg + play game over
+        self.sounds.stop_bg()
+        self.sounds.play_game_over()
 
-            return ("game_over", self.score, self.best_score)
+        return ("game_over", self.score, self.best_score)
 
-        keys = pygame.key.get_pressed()
-        self.ninja.update(keys)
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def release(self):
+        self.stop_recording()
 
+    def _spawn(self):
         for k in self.active_powerups:
             if self.active_powerups[k] > 0:
                 self.active_powerups[k] -= 1
 
         if self.difficulty.update(self.score):
-            self.floating_texts.append(
-                FloatingText(self.width // 2 - 100, self.height // 2, f"LEVEL {self.difficulty.level}!", GOLD, self.font)
+            self.floating_texts.spawn(
+                self.width // 2 - 100, self.height // 2, f"LEVEL {self.difficulty.level}!", GOLD, self.font
             )
 
         spawn_rate = self.difficulty.get_spawn_rate()
@@ -636,7 +816,7 @@ class GameScreen:
 
         # fruits
         if self.spawn_timer > spawn_rate:
-            self.fruits.append(Fruit(self.difficulty.get_fruit_speed(), self.small_font))
+            self.fruits.spawn(self.difficulty.get_fruit_speed(), self.small_font, self.rng)
             self.spawn_timer = 0
 
         # bombs: interval + burst + speed with level
@@ -648,141 +828,160 @@ class GameScreen:
             # optional: spread bombs in a burst so it's fairer
             used_x = []
             for _ in range(burst):
-                b = Bomb(bomb_speed_range)
+                b = self.bombs.spawn(bomb_speed_range, self.rng)
                 # try to keep some horizontal separation
                 for _try in range(6):
                     if all(abs(b.x - x) > 80 for x in used_x):
                         break
-                    b.x = random.randint(50, WIDTH - 50)
+                    b.x = self.rng.randint(50, WIDTH - 50)
                 used_x.append(b.x)
-                self.bombs.append(b)
 
-            self.bomb_spawn_timer = random.randint(-15, 0)
+            self.bomb_spawn_timer = self.rng.randint(-15, 0)
 
         # powerups
         if self.powerup_spawn_timer > 400:
-            self.powerups.append(PowerUp(self.tiny_font))
+            self.powerups.spawn(self.rng)
             self.powerup_spawn_timer = 0
 
-        slash_area = self.ninja.get_slash_area()
-
-        # fruits
-        for fruit in self.fruits[:]:
-            
+    def _update_fruits(self, blade):
+        # move + drop fallen fruit (walk backwards: despawn_at swaps the last one in)
+        fruits = self.fruits
+        grid = self.fruit_grid
+        grid.clear()
+        for i in range(len(fruits) - 1, -1, -1):
+            fruit = fruits[i]
             fruit.update()
-
-            if not fruit.sliced and fruit.get_rect().colliderect(slash_area):
-                fruit.sliced = True
-                self.fruits.remove(fruit)
-
-                points = fruit.points
-                if self.active_powerups["double_points"] > 0:
-                    points *= 2
-                if fruit.is_critical:
-                    points *= 2
-                    self.stats["critical_hits"] += 1
-                    self.floating_texts.append(FloatingText(fruit.x - 50, fruit.y, "CRITICAL!", GOLD, self.font))
-
-                self.score += points
-                self.combo += 1
-                self.max_combo = max(self.max_combo, self.combo)
-                self.stats["fruits_sliced"] += 1
-
-                self.ninja.trigger_slash()
-                self.sounds.play_slice()
-
-                for _ in range(25):
-                    self.particles.append(Particle(fruit.x, fruit.y, fruit.info["color"], "splash"))
-                    self.particles.append(Particle(fruit.x, fruit.y, fruit.info["inner"], "splash"))
-
-            elif fruit.y > self.height + 50:
-                if fruit in self.fruits:
-                    self.fruits.remove(fruit)
-                    self.combo = 0
-
-        # bombs
-        for bomb in self.bombs[:]:
-            
-            bomb.update()
-
-            if not bomb.sliced and bomb.get_rect().colliderect(slash_area):
-                bomb.sliced = True
-                self.bombs.remove(bomb)
-
-                self.bomb_hits += 1
+            if fruit.y > self.height + 50:
+                fruits.despawn_at(i)
                 self.combo = 0
-                self.stats["bombs_hit"] += 1
-
-                # (optional) also play slice sound on bomb hit
-                self.sounds.play_slice()
-
-                for _ in range(50):
-                    self.particles.append(Particle(bomb.x, bomb.y, (255, 100, 0), "explosion"))
-                    self.particles.append(Particle(bomb.x, bomb.y, (255, 200, 0), "explosion"))
-
-                self.floating_texts.append(
-                    FloatingText(bomb.x - 90, bomb.y, f"BOMB {self.bomb_hits}/{self.max_bomb_hits}", RED, self.font)
-                )
-
-            elif bomb.y > self.height + 50:
-                if bomb in self.bombs:
-                    self.bombs.remove(bomb)
+            else:
+                grid.insert(fruit, fruit.y)
+
+        # only fruit in the rows around the blade gets a swept test
+        for fruit in grid.query(blade.top, blade.bottom + self.query_reach):
+            if fruit.sliced or not blade.hits(fruit.x, fruit.prev_y, fruit.y, fruit.size):
+                continue
+            fruit.sliced = True
+            fruits.despawn(fruit)
+
+            points = fruit.points
+            if self.active_powerups["double_points"] > 0:
+                points *= 2
+            if fruit.is_critical:
+                points *= 2
+                self.stats["critical_hits"] += 1
+                self.floating_texts.spawn(fruit.x - 50, fruit.y, "CRITICAL!", GOLD, self.font)
+
+            self.score += points
+            self.combo += 1
+            self.max_combo = max(self.max_combo, self.combo)
+            self.stats["fruits_sliced"] += 1
+
+            self.ninja.trigger_slash()
+            self.sounds.play_slice()
+
+            n = quality.particles(25)
+            self.particles.emit(fruit.x, fruit.y, fruit.info["color"], "splash", n)
+            self.particles.emit(fruit.x, fruit.y, fruit.info["inner"], "splash", n)
+
+    def _update_bombs(self, blade):
+        bombs = self.bombs
+        grid = self.bomb_grid
+        grid.clear()
+        for i in range(len(bombs) - 1, -1, -1):
+            bomb = bombs[i]
+            bomb.update()
+            if bomb.y > self.height + 50:
+                bombs.despawn_at(i)
+            else:
+                grid.insert(bomb, bomb.y)
+
+        for bomb in grid.query(blade.top, blade.bottom + self.query_reach):
+            if bomb.sliced or not blade.hits(bomb.x, bomb.prev_y, bomb.y, bomb.size):
+                continue
+            bomb.sliced = True
+            bombs.despawn(bomb)
+
+            self.bomb_hits += 1
+            self.combo = 0
+            self.stats["bombs_hit"] += 1
+
+            # (optional) also play slice sound on bomb hit
+            self.sounds.play_slice()
+
+            n = quality.particles(50)
+            self.particles.emit(bomb.x, bomb.y, (255, 100, 0), "explosion", n)
+            self.particles.emit(bomb.x, bomb.y, (255, 200, 0), "explosion", n)
+
+            self.floating_texts.spawn(
+                bomb.x - 90, bomb.y, f"BOMB {self.bomb_hits}/{self.max_bomb_hits}", RED, self.font
+            )
 
-        # powerups
-        for p in self.powerups[:]:
-            
+    def _update_powerups(self, blade):
+        powerups = self.powerups
+        grid = self.powerup_grid
+        grid.clear()
+        for i in range(len(powerups) - 1, -1, -1):
+            p = powerups[i]
             p.update()
+            if p.y > self.height + 50:
+                powerups.despawn_at(i)
+            else:
+                grid.insert(p, p.y)
 
-            if not p.sliced and p.get_rect().colliderect(slash_area):
-                p.sliced = True
-                self.powerups.remove(p)
-                self.active_powerups[p.type] = 300
-                self.stats["powerups_collected"] += 1
-
-                # slice sound works here too
-                self.sounds.play_slice()
+        for p in grid.query(blade.top, blade.bottom + self.query_reach):
+            if p.sliced or not blade.hits(p.x, p.prev_y, p.y, p.size):
+                continue
+            p.sliced = True
+            powerups.despawn(p)
+            self.active_powerups[p.type] = 300
+            self.stats["powerups_collected"] += 1
 
-                msg = {"freeze": "TIME FREEZE!", "double_points": "DOUBLE POINTS!", "frenzy": "FRUIT FRENZY!"}[p.type]
-                self.floating_texts.append(FloatingText(p.x - 80, p.y, msg, p.get_color(), self.font))
+            # slice sound works here too
+            self.sounds.play_slice()
 
-                for _ in range(30):
-                    self.particles.append(Particle(p.x, p.y, p.get_color(), "splash"))
+            msg = {"freeze": "TIME FREEZE!", "double_points": "DOUBLE POINTS!", "frenzy": "FRUIT FRENZY!"}[p.type]
+            self.floating_texts.spawn(p.x - 80, p.y, msg, p.get_color(), self.font)
 
-            elif p.y > self.height + 50:
-                if p in self.powerups:
-                    self.powerups.remove(p)
+            self.particles.emit(p.x, p.y, p.get_color(), "splash", quality.particles(30))
 
+    def _update_effects(self):
         # particles / floating text
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
 
-        for text in self.floating_texts[:]:
+        floating = self.floating_texts
+        for i in range(len(floating) - 1, -1, -1):
+            text = floating[i]
             text.update()
             if text.lifetime <= 0:
-                self.floating_texts.remove(text)
-
-        return None
+                floating.despawn_at(i)
 
     def draw(self, surface):
-        draw_background(surface, self.game_time_ms)
-
-        for particle in self.particles:
-            particle.draw(surface)
+        alpha = self.timestep.alpha
+        with profiler.section("background"):
+            self.background.draw(surface, self.game_time_ms, quality.animated_background)
+        with profiler.section("particles_draw"):
+            self.particles.draw(surface, alpha)
+        with profiler.section("entities_draw"):
+            self._draw_entities(surface, alpha)
+        with profiler.section("hud"):
+            self._draw_hud(surface)
+
+    def _draw_entities(self, surface, alpha):
         for fruit in self.fruits:
-            fruit.draw(surface)
+            fruit.draw(surface, alpha)
         for bomb in self.bombs:
-            bomb.draw(surface)
+            bomb.draw(surface, alpha)
         for p in self.powerups:
-            p.draw(surface)
+            p.draw(surface, alpha)
 
-        self.ninja.draw(surface)
+        self.ninja.draw(surface, alpha)
 
         for text in self.floating_texts:
-            text.draw(surface)
+            text.draw(surface, alpha)
 
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+    def _draw_hud(self, surface):
+        score_text = texts.render(self.font, f"Score: {self.score}", WHITE)
         surface.blit(score_text, (20, 20))
 
         # ------------------ DRAW HEARTS (LIVES) ------------------
@@ -796,10 +995,10 @@ class GameScreen:
 
         if self.combo > 1:
             combo_color = GOLD if self.combo >= 10 else (YELLOW if self.combo >= 5 else WHITE)
-            combo_text = self.font.render(f"x{self.combo} COMBO!", True, combo_color)
+            combo_text = texts.render(self.font, f"x{self.combo} COMBO!", combo_color)
             surface.blit(combo_text, (self.width // 2 - 90, 20))
 
-        level_text = self.small_font.render(f"Level: {self.difficulty.level}", True, WHITE)
+        level_text = texts.render(self.small_font, f"Level: {self.difficulty.level}", WHITE)
         surface.blit(level_text, (20, 60))
 
         # bomb_text = self.small_font.render(f"Bomb hits: {self.bomb_hits}/{self.max_bomb_hits}", True, (255, 200, 200))
@@ -809,12 +1008,15 @@ class GameScreen:
         
 
         if self.active_powerups["double_points"] > 0:
-            surface.blit(self.small_font.render("x2 Points", True, GOLD), (20, y0))
+            surface.blit(texts.render(self.small_font, "x2 Points", GOLD), (20, y0))
             y0 += 22
         if self.active_powerups["frenzy"] > 0:
-            surface.blit(self.small_font.render("Frenzy", True, PURPLE), (20, y0))
+            surface.blit(texts.render(self.small_font, "Frenzy", PURPLE), (20, y0))
             y0 += 22
 
+        q = texts.render(self.tiny_font, f"Quality: {quality.name}", (170, 170, 185))
+        surface.blit(q, (20, self.height - 28))
+
         if self.paused:
-            t = self.font.render("PAUSED - Press P", True, WHITE)
+            t = texts.render(self.font, "PAUSED - Press P", WHITE)
             surface.blit(t, t.get_rect(center=(self.width // 2, self.height // 2)))
@@ -1,9 +1,39 @@
+import os
+
 import pygame
 from settings import COLORS, WIDTH, HEIGHT
+from engine.animation import AnimatedSprite
+from engine.assets import assets
+from engine.loader import AssetLoader
+
+NINJA = "assets/images/Ninja.png"
+BACKGROUND = "assets/images/1.png"
+
+
+def asset_manifest(width=WIDTH, height=HEIGHT):
+    return [
+        ("image", BACKGROUND, (width, height), False),
+        ("image", NINJA, (width, height), True),
+    ]
+
+
+def _image_key(entry):
+    # the cache key an ("image", path, size, alpha) entry ends up under
+    return os.path.normpath(assets.resolve(entry[1])), tuple(entry[2]), entry[3]
 
 
 class LoadingScreen:
-    def __init__(self, width=WIDTH, height=HEIGHT):
+    """
+    Shows progress while the other screens' assets load in the background.
+
+    `manifest` lists what to load (see AssetLoader), or is a callable
+    returning that list; a callable is only called on the first update,
+    so building it doesn't delay the first frame. The screen's own
+    images are queued first and drawn as soon as they arrive; until then
+    it is a plain fill with the progress bar.
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT, manifest=()):
         self.width = width
         self.height = height
 
@@ -16,32 +46,39 @@ class LoadingScreen:
         self.show_title = False
 
         self.font = pygame.font.SysFont("arial", 48, bold=True)
-        self.start_ms = 0
-
-#   moving ninja animation  # LOAD BACKGROUND ONCE
-        self.movingNinja = pygame.image.load(
-            "assets/images/Ninja.png"
-        ).convert_alpha()
-        self.movingNinja = pygame.transform.smoothscale(
-             self.movingNinja, (self.width, self.height)
-        )
-
-        self.movingNinjaX = -200
 
-
-        
-        # LOAD BACKGROUND ONCE
-        self.background = pygame.image.load(
-            "assets/images/1.png"
-        ).convert()
-        self.background = pygame.transform.smoothscale(
-            self.background, (self.width, self.height)
+        # own images first so they show up early, then everything else
+        self.loader = AssetLoader(asset_manifest(width, height))
+        self.manifest = manifest
+        # own images another screen also asked for; release() keeps these
+        self._shared = set()
+
+        # set once the images are in the cache (see _pick_up_images)
+        self.movingNinja = None
+        self.ninja_slide = None
+        self.background = None
+        self.elapsed = 0.0
+
+    def _pick_up_images(self):
+        size = (self.width, self.height)
+        if not (assets.has(BACKGROUND, size, False) and assets.has(NINJA, size, True)):
+            return
+        self.background = assets.image(BACKGROUND, size, alpha=False)
+        self.movingNinja = assets.image(NINJA, size)
+
+        # slides in from the left at 300 px/s and stops at WIDTH - 300
+        ninja_y = HEIGHT - self.movingNinja.get_height() + 50
+        self.ninja_slide = AnimatedSprite(
+            [self.movingNinja], loop=False,
+            start=(-200, ninja_y), end=(WIDTH - 300, ninja_y),
+            travel_time=(WIDTH - 300 + 200) / 300,
         )
 
     def enter(self):
         self.angle = -60
         self.show_title = False
-        self.start_ms = pygame.time.get_ticks()
+        self.elapsed = 0.0
+        self.loader.start()
 
     def handle_event(self, event):
         # Optional: allow skipping loading with any key
@@ -49,22 +86,61 @@ class LoadingScreen:
             return "menu"
         return None
 
+    def _take_manifest(self):
+        entries = self.manifest() if callable(self.manifest) else self.manifest
+        self.manifest = None
+        own = {_image_key(e) for e in asset_manifest(self.width, self.height)}
+        self._shared = own & {_image_key(e) for e in entries if e[0] == "image"}
+        return entries
+
+    def release(self):
+        # the full-screen copies are only used here, unless another
+        # screen's manifest lists the same image (gameplay background "1")
+        if self.manifest is not None:
+            self._take_manifest()
+        for entry in asset_manifest(self.width, self.height):
+            if _image_key(entry) not in self._shared:
+                assets.evict(entry[1], entry[2], entry[3])
+        self.loader.close()
+        self.background = None
+        self.movingNinja = None
+        self.ninja_slide = None
+
     def update(self, dt):
-        if self.movingNinjaX < WIDTH-300:
-             self.movingNinjaX += 300 * dt  # Move right at 300 pixels per second
+        if self.manifest is not None:
+            self.loader.extend(self._take_manifest())
+        self.loader.poll()
+        if self.background is None:
+            self._pick_up_images()
+            if self.background is None:
+                return "menu" if self.loader.done else None
+
+        self.elapsed += dt
         if self.angle < 0:
             self.angle += 240 * dt  # 4 per frame at 60fps ≈ 240 per second
         else:
             self.show_title = True
 
-        # End loading after 2.5 seconds
-        if pygame.time.get_ticks() - self.start_ms > 3500:
+        # done as soon as everything is loaded
+        if self.loader.done:
             return "menu"
         return None
 
     def draw(self, surface):
-        surface.blit(self.background, (0, 0))
-        surface.blit(self.movingNinja, (self.movingNinjaX, HEIGHT-self.movingNinja.get_height()+50))
+        if self.background is None:
+            surface.fill(self.bg_color)
+        else:
+            surface.blit(self.background, (0, 0))
+            self.ninja_slide.draw(surface, self.elapsed, anchor="topleft")
+
+        # progress bar
+        bar = pygame.Rect(0, 0, self.width // 2, 12)
+        bar.center = (self.width // 2, self.height - 30)
+        fill = bar.copy()
+        fill.width = int(bar.width * self.loader.progress)
+        pygame.draw.rect(surface, self.bg_color, bar)
+        pygame.draw.rect(surface, self.ninja_color, fill)
+        pygame.draw.rect(surface, self.text_color, bar, 1)
 
 
 
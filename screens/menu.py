@@ -1,8 +1,12 @@
 import pygame
 from settings import WIDTH, HEIGHT, COLORS
+from engine.assets import assets
 
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+BACKGROUND = "assets/images/loading_screen.png"
+
+
+def asset_manifest(width=WIDTH, height=HEIGHT):
+    return [("image", BACKGROUND, (width, height), False)]
 
 
 class MenuScreen:
@@ -18,15 +22,18 @@ class MenuScreen:
         self.text = COLORS["text"]
 
         # LOAD BACKGROUND ONCE
-        self.background = pygame.image.load(
-            "assets/images/loading_screen.png"
-        ).convert()
-        self.background = pygame.transform.smoothscale(
-            self.background, (self.width, self.height)
-        )
+        self.background = assets.image(BACKGROUND, (self.width, self.height), alpha=False)
+        self._needs_redraw = True
 
     def enter(self):
-        pass
+        self._needs_redraw = True
+
+    def invalidate(self):
+        self._needs_redraw = True
+
+    def is_idle(self):
+        # nothing animates here: once drawn, wait for input
+        return not self._needs_redraw
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
@@ -42,4 +49,8 @@ class MenuScreen:
         return None
 
     def draw(self, surface):
+        if not self._needs_redraw:
+            return []
         surface.blit(self.background, (0, 0))
+        self._needs_redraw = False
+        return None
@@ -9,3 +9,51 @@ COLORS = {
     "red": (216, 52, 26),
     "text": (246, 242, 232),
 }
+
+# Fruit rotation cache: degrees between pre-rendered frames (smaller = smoother,
+# more memory) and how many rotated frames may be kept at once.
+ROTATION_STEP = 6
+ROTATION_CACHE_SIZE = 512
+
+# Gameplay background: "dojo" (drawn sky scene), "gameplay" or "1".."5" (images)
+GAMEPLAY_BACKGROUND = "dojo"
+
+# Rendered text surfaces kept around (bytes of pixel data)
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+
+# Simulation runs at a fixed tick rate; rendering is independent of it.
+# RENDER_FPS = 0 renders as fast as possible. A slow frame runs at most
+# MAX_CATCH_UP_STEPS ticks, the rest of the backlog is dropped.
+SIM_HZ = 60
+RENDER_FPS = FPS
+MAX_CATCH_UP_STEPS = 5
+
+# Quality governor: drops effects when frames take longer than the budget.
+# Set QUALITY_PIN to "low", "medium" or "high" to turn the governor off.
+FRAME_BUDGET_MS = 1000 / FPS
+QUALITY_PIN = None
+
+# Pre-scaled pixels / decoded audio are kept here between runs (see engine.disk_cache)
+ASSET_CACHE_DIR = ".asset_cache"
+USE_DISK_CACHE = True
+
+# Input replays: one byte per tick plus the session seed (see engine.replay).
+# RECORD_REPLAYS (or `python main.py --record`) writes every round to REPLAY_DIR.
+REPLAY_DIR = "replays"
+RECORD_REPLAYS = False
+
+# Finished runs are stored here (SQLite); the game over screen lists the best few
+LEADERBOARD_PATH = "scores.db"
+LEADERBOARD_SIZE = 5
+
+# Mixer channels reserved for each sound group (music streams separately).
+# A group never plays more voices than this; slices closer together than
+# SLICE_MIN_INTERVAL_MS are dropped.
+AUDIO_GROUPS = {"slice": 4, "stinger": 2}
+SLICE_MIN_INTERVAL_MS = 35
+
+# Screens draw on a WIDTH x HEIGHT canvas that is scaled to the window
+# (see engine.display): "integer" (whole factors where they fill most of
+# the window, nearest neighbour), "fit" (any factor, nearest neighbour)
+# or "smooth" (any factor, filtered)
+SCALE_MODE = "integer"
@@ -0,0 +1,179 @@
+# tools/bench.py
+"""
+Headless GameScreen benchmark.
+
+    python -m tools.bench --frames 5000 --seed 1 --level 7
+    python -m tools.bench --replay replays/<file>.rep
+    python -m tools.bench --retries 500
+
+Runs one fixed simulation tick plus a draw per frame, as fast as
+possible (no clock.tick), and prints throughput, per-frame p50/p99
+and entity counts. --retries instead measures what starting a new
+round costs compared to building the GameScreen.
+"""
+import argparse
+import time
+
+from tools.headless import init_headless, seed_everything, percentile
+
+
+def count_entities(game):
+    return {
+        "fruits": len(game.fruits),
+        "bombs": len(game.bombs),
+        "powerups": len(game.powerups),
+        "particles": len(game.particles),
+        "texts": len(game.floating_texts),
+    }
+
+
+def run(frames, seed, level=1, draw=True, replay=None):
+    surface = init_headless()
+
+    from screens.gameplay import GameScreen
+
+    seed_everything(seed)
+    game = GameScreen()
+    game.record_replays = False
+    if replay is not None:
+        # one recorded round, tick for tick; frames is ignored
+        game.enter(replay=replay)
+        frames = len(replay) + 1
+    else:
+        game.enter(seed)
+        game.difficulty.level = level
+
+    frame_ms = []
+    peak = count_entities(game)
+    totals = dict.fromkeys(peak, 0)
+    rounds = 1
+
+    perf = time.perf_counter
+    start = perf()
+    for _ in range(frames):
+        t0 = perf()
+        action = game.tick()
+        if draw:
+            game.draw(surface)
+        frame_ms.append((perf() - t0) * 1000)
+
+        counts = count_entities(game)
+        for k, v in counts.items():
+            totals[k] += v
+            peak[k] = max(peak[k], v)
+
+        if isinstance(action, tuple) and action[0] == "game_over":
+            if replay is not None:
+                frames = len(frame_ms)
+                break
+            game.enter(seed + rounds)
+            game.difficulty.level = level
+            rounds += 1
+    elapsed = perf() - start
+
+    frame_ms.sort()
+    return {
+        "frames": frames,
+        "rounds": rounds,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(frame_ms, 50),
+        "p99_ms": percentile(frame_ms, 99),
+        "max_ms": frame_ms[-1] if frame_ms else 0.0,
+        "mean": {k: v / frames for k, v in totals.items()},
+        "peak": peak,
+        "score": game.score,
+    }
+
+
+def run_retries(retries, seed, ticks=600):
+    init_headless()
+
+    import tracemalloc
+    from screens.gameplay import GameScreen
+
+    seed_everything(seed)
+    perf = time.perf_counter
+    t0 = perf()
+    game = GameScreen()
+    build_ms = (perf() - t0) * 1000
+    game.record_replays = False
+
+    def play():
+        # play a while first so the round being thrown away has live entities
+        for _ in range(ticks):
+            if game.tick() is not None:
+                break
+
+    enter_ms = []
+    for i in range(retries):
+        play()
+        t0 = perf()
+        game.enter(seed + i)
+        enter_ms.append((perf() - t0) * 1000)
+
+    # memory kept per retry, in a separate pass (tracemalloc skews timings)
+    net_bytes = []
+    tracemalloc.start()
+    for i in range(min(retries, 50)):
+        play()
+        before = tracemalloc.get_traced_memory()[0]
+        game.enter(seed + i)
+        net_bytes.append(tracemalloc.get_traced_memory()[0] - before)
+    tracemalloc.stop()
+
+    enter_ms.sort()
+    pools = {name: getattr(game, name).pool for name in ("fruits", "bombs", "powerups", "floating_texts")}
+    return {
+        "retries": retries,
+        "build_ms": build_ms,
+        "p50_ms": percentile(enter_ms, 50),
+        "p99_ms": percentile(enter_ms, 99),
+        "max_ms": enter_ms[-1] if enter_ms else 0.0,
+        "net_bytes": sum(net_bytes) / len(net_bytes) if net_bytes else 0.0,
+        "pools": {name: (p.created, p.reused) for name, p in pools.items()},
+    }
+
+
+def report_retries(result):
+    print(f"build    GameScreen() {result['build_ms']:.1f} ms")
+    print(f"retry    enter() x{result['retries']}   p50 {result['p50_ms'] * 1000:.1f} us"
+          f"   p99 {result['p99_ms'] * 1000:.1f} us   max {result['max_ms'] * 1000:.1f} us")
+    print(f"memory   {result['net_bytes']:+.0f} bytes kept per retry")
+    print("pools    " + "  ".join(
+        f"{name} {created}/{reused}" for name, (created, reused) in result["pools"].items()
+    ) + "   (created/reused)")
+
+
+def report(result):
+    print(f"frames   {result['frames']}  ({result['rounds']} rounds, {result['seconds']:.2f} s)")
+    print(f"fps      {result['fps']:.0f}   (last round score {result['score']})")
+    print(f"frame    p50 {result['p50_ms']:.3f} ms   p99 {result['p99_ms']:.3f} ms   max {result['max_ms']:.3f} ms")
+    print("entities " + "  ".join(
+        f"{k} {result['mean'][k]:.1f}/{result['peak'][k]}" for k in result["peak"]
+    ) + "   (mean/peak)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless GameScreen benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1, help="difficulty level to start at")
+    parser.add_argument("--no-draw", action="store_true", help="only run simulation ticks")
+    parser.add_argument("--replay", help="replay a recorded round instead of idling")
+    parser.add_argument("--retries", type=int, default=0, help="measure N round restarts instead")
+    args = parser.parse_args()
+
+    if args.retries:
+        report_retries(run_retries(args.retries, args.seed))
+        return
+
+    replay = None
+    if args.replay:
+        from engine.replay import InputReplay
+        replay = InputReplay(args.replay)
+    report(run(args.frames, args.seed, args.level, draw=not args.no_draw, replay=replay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# tools/headless.py
+import os
+import random
+import sys
+
+# run from anywhere: the game imports settings/screens from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def init_headless(width=None, height=None):
+    """
+    Start pygame with no window and no sound.
+
+    Uses SDL's dummy video driver and leaves the mixer uninitialised,
+    so SoundBank turns itself off. Returns the display surface.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    import pygame
+    from settings import WIDTH, HEIGHT
+
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.display.set_mode((width or WIDTH, height or HEIGHT))
+
+
+def seed_everything(seed):
+    random.seed(seed)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[i]
@@ -0,0 +1,136 @@
+# tools/soak.py
+"""
+Long-running autoplayer session for finding leaks and slowdowns.
+
+    python -m tools.soak --skill expert --minutes 30
+    python -m tools.soak --frames 200000 --report-every 20000 --no-draw
+
+The bot plays GameScreen with no window and no frame cap, restarting
+whenever it loses. Every --report-every frames a line shows throughput,
+frame times, process memory, live Python objects and cache sizes; the
+summary compares the first and last windows (memory growth, frame-time
+creep).
+"""
+import argparse
+import gc
+import os
+import time
+
+from tools.bench import count_entities
+from tools.headless import init_headless, seed_everything, percentile
+
+
+def rss_mb():
+    # resident set size now (Linux), else the peak so far
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def snapshot(game, frame_ms, frames, seconds):
+    from engine.rotation import rotations
+    from engine.text_cache import texts
+
+    frame_ms.sort()
+    return {
+        "frames": frames,
+        "fps": len(frame_ms) / seconds if seconds else 0.0,
+        "p50_ms": percentile(frame_ms, 50),
+        "p99_ms": percentile(frame_ms, 99),
+        "rss_mb": rss_mb(),
+        "objects": len(gc.get_objects()),
+        "text_kb": texts.bytes / 1024,
+        "rotations": len(rotations._frames),
+        "entities": sum(count_entities(game).values()),
+    }
+
+
+def run(frames, minutes, skill, seed, level=1, draw=True, report_every=10000):
+    surface = init_headless()
+
+    from engine.autoplay import AutoPlayer
+    from screens.gameplay import GameScreen
+
+    seed_everything(seed)
+    game = GameScreen()
+    game.record_replays = False
+    game.autoplayer = AutoPlayer(skill)
+    game.enter(seed)
+    game.difficulty.level = level
+
+    deadline = time.perf_counter() + minutes * 60 if minutes else None
+    windows = []
+    window_ms = []
+    rounds = 1
+    levels = []
+
+    perf = time.perf_counter
+    window_start = perf()
+    n = 0
+    while (not frames or n < frames) and (deadline is None or perf() < deadline):
+        t0 = perf()
+        action = game.tick()
+        if draw:
+            game.draw(surface)
+        window_ms.append((perf() - t0) * 1000)
+        n += 1
+
+        if isinstance(action, tuple) and action[0] == "game_over":
+            levels.append(game.difficulty.level)
+            game.enter(seed + rounds)
+            game.difficulty.level = level
+            rounds += 1
+
+        if n % report_every == 0:
+            w = snapshot(game, window_ms, n, perf() - window_start)
+            windows.append(w)
+            print(f"{w['frames']:>9}  {w['fps']:7.0f} fps  p50 {w['p50_ms']:.3f}  p99 {w['p99_ms']:.3f} ms"
+                  f"  rss {w['rss_mb']:7.1f} MB  objects {w['objects']:>8}  text {w['text_kb']:6.0f} KB"
+                  f"  rotations {w['rotations']:>4}  entities {w['entities']:>4}  level {game.difficulty.level}",
+                  flush=True)
+            window_ms = []
+            window_start = perf()
+
+    return {"frames": n, "rounds": rounds, "levels": levels, "windows": windows}
+
+
+def report(result):
+    levels = result["levels"]
+    print(f"frames   {result['frames']}  ({result['rounds']} rounds"
+          + (f", level reached avg {sum(levels) / len(levels):.1f} max {max(levels)}" if levels else "") + ")")
+    windows = result["windows"]
+    if len(windows) < 2:
+        print("(too short for a trend: lower --report-every)")
+        return
+    # the first window includes warm-up (caches filling), compare from the second
+    first, last = windows[1] if len(windows) > 2 else windows[0], windows[-1]
+    print(f"memory   {first['rss_mb']:.1f} -> {last['rss_mb']:.1f} MB  ({last['rss_mb'] - first['rss_mb']:+.1f})")
+    print(f"objects  {first['objects']} -> {last['objects']}  ({last['objects'] - first['objects']:+d})")
+    creep = (last["p50_ms"] / first["p50_ms"] - 1) * 100 if first["p50_ms"] else 0.0
+    print(f"frame    p50 {first['p50_ms']:.3f} -> {last['p50_ms']:.3f} ms  ({creep:+.1f}%)"
+          f"   p99 {first['p99_ms']:.3f} -> {last['p99_ms']:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autoplayer soak test")
+    parser.add_argument("--skill", default="expert", help="novice, average or expert")
+    parser.add_argument("--frames", type=int, default=0, help="stop after this many frames (0: no limit)")
+    parser.add_argument("--minutes", type=float, default=0, help="stop after this much wall time (0: no limit)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1, help="difficulty level to start each round at")
+    parser.add_argument("--report-every", type=int, default=10000, help="frames per report line")
+    parser.add_argument("--no-draw", action="store_true", help="only run simulation ticks")
+    args = parser.parse_args()
+    if not args.frames and not args.minutes:
+        args.frames = 100000
+
+    report(run(args.frames, args.minutes, args.skill, args.seed, args.level,
+               draw=not args.no_draw, report_every=args.report_every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# tools/sweep.py
+"""
+Difficulty sweeps: many seeded headless games across all CPU cores.
+
+    python -m tools.sweep --games 20
+    python -m tools.sweep --grid base_spawn_rate=40,50,60 --grid "base_bomb_speed=(3.0, 5.0),(4.0, 6.0)"
+    python -m tools.sweep --policy greedy --policy bot:expert --max-minutes 5
+
+Every combination of --grid values (any DifficultyManager attribute)
+is played --games times per input policy, in a process pool. Games
+only tick the simulation, nothing is drawn. The table shows survival
+time, score and level reached (means), peak on-screen entities and the
+cost of one tick.
+"""
+import argparse
+import ast
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.headless import init_headless, seed_everything, percentile
+
+
+# ------------------ INPUT POLICIES ------------------
+# Same interface as engine.autoplay.AutoPlayer: reset(seed), decide(game) -> input bits
+
+class IdlePolicy:
+    def reset(self, seed=None):
+        pass
+
+    def decide(self, game):
+        return 0
+
+
+class RandomPolicy:
+    """Mashes random keys, holding each choice for a few ticks."""
+
+    def __init__(self, hold=10):
+        self.hold = hold
+        self.rng = random.Random()
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+        self.wait = 0
+        self.bits = 0
+
+    def decide(self, game):
+        from engine.replay import LEFT, RIGHT, SPACE
+
+        if self.wait > 0:
+            self.wait -= 1
+            return self.bits
+        self.wait = self.hold - 1
+        self.bits = self.rng.choice((0, LEFT, RIGHT)) | (SPACE if self.rng.random() < 0.1 else 0)
+        return self.bits
+
+
+class GreedyPolicy:
+    """Runs under the fruit that reaches the blade first; ignores bombs."""
+
+    def reset(self, seed=None):
+        pass
+
+    def decide(self, game):
+        from engine.replay import LEFT, RIGHT
+
+        ninja = game.ninja
+        band = ninja.slash_rect.top
+        target = None
+        soonest = None
+        for fruit in game.fruits:
+            if fruit.y > band:
+                continue
+            t = (band - fruit.y) / fruit.speed
+            if soonest is None or t < soonest:
+                target, soonest = fruit, t
+        if target is None:
+            return 0
+        dx = target.x - ninja.slash_rect.centerx
+        if dx > ninja.speed:
+            return RIGHT
+        if dx < -ninja.speed:
+            return LEFT
+        return 0
+
+
+def make_policy(name):
+    if name == "idle":
+        return IdlePolicy()
+    if name == "random":
+        return RandomPolicy()
+    if name == "greedy":
+        return GreedyPolicy()
+    if name.startswith("bot:"):
+        from engine.autoplay import AutoPlayer
+        return AutoPlayer(name[4:])
+    raise ValueError(f"unknown policy {name!r}: idle, random, greedy or bot:<skill>")
+
+
+# ------------------ WORKERS ------------------
+_game = None
+
+
+def _init_worker():
+    global _game
+    init_headless()
+    from screens.gameplay import GameScreen
+
+    _game = GameScreen()
+    _game.record_replays = False
+
+
+def play(task):
+    """One game: (set index, params, policy name, seed, tick limit) -> stats."""
+    index, params, policy, seed, max_ticks = task
+    game = _game
+    seed_everything(seed)
+    game.difficulty_params = params
+    game.autoplayer = make_policy(policy)
+    game.enter(seed)
+
+    tick_ms = []
+    peak = 0
+    perf = time.perf_counter
+    ticks = 0
+    while ticks < max_ticks:
+        t0 = perf()
+        action = game.tick()
+        tick_ms.append((perf() - t0) * 1000)
+        ticks += 1
+        peak = max(peak, len(game.fruits) + len(game.bombs) + len(game.powerups))
+        if action is not None:
+            break
+
+    tick_ms.sort()
+    return {
+        "set": index,
+        "policy": policy,
+        "ticks": ticks,
+        "survived": ticks >= max_ticks,
+        "score": game.score,
+        "level": game.difficulty.level,
+        "peak": peak,
+        "tick_ms": sum(tick_ms) / len(tick_ms),
+        "p99_ms": percentile(tick_ms, 99),
+    }
+
+
+# ------------------ DRIVER ------------------
+def parse_grid(specs):
+    # ["name=v1,v2", ...] -> list of {name: value} dicts, one per combination
+    axes = []
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        values = values.strip()
+        if not values.startswith("["):
+            values = f"[{values}]"
+        axes.append([(name.strip(), v) for v in ast.literal_eval(values)])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def sweep(param_sets, policies, games, seed, max_ticks, workers=None):
+    tasks = [
+        (i, params, policy, seed + g, max_ticks)
+        for i, params in enumerate(param_sets)
+        for policy in policies
+        for g in range(games)
+    ]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(play, tasks, chunksize=max(1, len(tasks) // (workers * 8))))
+
+
+def summarize(results, param_sets, sim_hz):
+    rows = {}
+    for r in results:
+        rows.setdefault((r["set"], r["policy"]), []).append(r)
+
+    print(f"{'set':<4} {'policy':<12} {'games':>5} {'survive s':>9} {'p50 s':>7} {'alive':>5} "
+          f"{'score':>7} {'level':>6} {'peak':>5} {'tick us':>8} {'p99 us':>7}")
+    for (index, policy), rs in sorted(rows.items()):
+        n = len(rs)
+        seconds = sorted(r["ticks"] / sim_hz for r in rs)
+        print(f"{index:<4} {policy:<12} {n:>5} {sum(seconds) / n:>9.1f} {percentile(seconds, 50):>7.1f} "
+              f"{sum(r['survived'] for r in rs):>5} "
+              f"{sum(r['score'] for r in rs) / n:>7.0f} {sum(r['level'] for r in rs) / n:>6.1f} "
+              f"{max(r['peak'] for r in rs):>5} "
+              f"{sum(r['tick_ms'] for r in rs) / n * 1000:>8.0f} {max(r['p99_ms'] for r in rs) * 1000:>7.0f}")
+    print()
+    for index, params in enumerate(param_sets):
+        print(f"{index:<4} {params or 'defaults'}")
+
+
+def main():
+    from settings import SIM_HZ
+
+    parser = argparse.ArgumentParser(description="Parallel headless difficulty sweep")
+    parser.add_argument("--grid", action="append", default=[],
+                        help="NAME=V1,V2,... DifficultyManager attribute and values to try (repeatable)")
+    parser.add_argument("--policy", action="append",
+                        help="idle, random, greedy or bot:<skill> (repeatable, default: all three built-ins)")
+    parser.add_argument("--games", type=int, default=10, help="games per parameter set and policy")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-minutes", type=float, default=10, help="simulated time limit per game")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    policies = args.policy or ["idle", "random", "greedy"]
+    for name in policies:
+        make_policy(name)   # fail early on typos
+    param_sets = parse_grid(args.grid)
+    from screens.gameplay import DifficultyManager
+    for params in param_sets:
+        DifficultyManager(**params)   # unknown names raise here, not in a worker
+    max_ticks = int(args.max_minutes * 60 * SIM_HZ)
+
+    start = time.perf_counter()
+    results = sweep(param_sets, policies, args.games, args.seed, max_ticks, args.workers)
+    print(f"{len(results)} games in {time.perf_counter() - start:.1f} s\n")
+    summarize(results, param_sets, SIM_HZ)
+
+
+if __name__ == "__main__":
+    main()